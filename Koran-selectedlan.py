@@ -1,80 +1,276 @@
 # save as stt_translate_pyqt.py
 import sys
 import os
+import re
+import asyncio
+import atexit
+import io
+import hashlib
 import tempfile
 import threading
-import requests
+import queue
+import socket
+from collections import deque
+from concurrent.futures import Future
+import httpx
 from gtts import gTTS
 import pygame
+import numpy as np
+import sounddevice as sd
 
-from PyQt5.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QTextEdit, QLabel, QComboBox
-)
-from PyQt5.QtCore import Qt, pyqtSignal, QObject
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QThreadPool
 
 import speech_recognition as sr
 
+from languages import RECOGNIZER_LANG_TAG
+from translator_ui import Backend, MainWindow, Task, signals
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    import json
+    json_loads = json.loads
+
+try:
+    import webrtcvad
+except ImportError:
+    webrtcvad = None  # fall back to an energy threshold
+
+try:
+    from faster_whisper import WhisperModel
+except ImportError:
+    WhisperModel = None  # transcribe with Google only
 
-# Simple signals helper
-
-class Signals(QObject):
-    transcription_ready = pyqtSignal(str)
-    translation_ready = pyqtSignal(str)
-    set_status = pyqtSignal(str)
-
-signals = Signals()
-
-
-# Config / language map (LibreTranslate + gTTS use ISO codes)
-# You can expand this map to whatever you need.
-
-LANGS = {
-    "English": "en",
-    "Korean": "ko",
-    "Vietnamese": "vi",
-    "Burmese": "my",
-    "Khmer": "km",
-    "Chinese (Simplified)": "zh",
-    "Japanese": "ja",
-    "French": "fr",
-    "Spanish": "es"
-}
-
-# helper to map for Google recognizer language tags
-RECOGNIZER_LANG_TAG = {
-    "ko": "ko-KR",
-    "en": "en-US",
-    "vi": "vi-VN",
-    "my": "my-MM",   # might not be supported by recognizer
-    "km": "km-KH",   # might not be supported
-    "zh": "zh-CN",
-    "ja": "ja-JP",
-    "fr": "fr-FR",
-    "es": "es-ES"
-}
 
 # Translation endpoints
 GOOGLE_TRANSLATE_URL = "https://translate.googleapis.com/translate_a/single"
 MYMEMORY_URL = "https://api.mymemory.translated.net/get"
+# Longer texts are cut at sentence ends and the pieces translated in parallel
+LONG_TEXT_CHUNK = 1500
+SENTENCE_RE = re.compile(r"[^.!?。？！\n]*(?:[.!?。？！]+|\n|$)\s*")
+# Targets written without spaces between sentences
+UNSPACED_TARGETS = {"zh", "ja"}
+
+# webrtcvad end-of-speech detection (20 ms frames at 16 kHz)
+VAD_SAMPLE_RATE = 16000
+VAD_FRAME_MS = 20
+VAD_FRAME_SAMPLES = VAD_SAMPLE_RATE * VAD_FRAME_MS // 1000
+VAD_AGGRESSIVENESS = 2
+VAD_SILENCE_MS = 300      # stop this long after speech ends
+VAD_PREROLL_MS = 200      # keep a little audio from before speech starts
+VAD_START_TIMEOUT = 8     # seconds to wait for speech to begin
+VAD_MAX_PHRASE = 12       # hard cap on utterance length in seconds
+
+# Local speech recognition (used when faster-whisper is installed)
+WHISPER_MODEL_SIZE = "small"
+
+# One recognizer for the app; its energy threshold gates speech when
+# webrtcvad is missing and carries over between recordings
+RECOGNIZER = sr.Recognizer()
+RECOGNIZER.dynamic_energy_threshold = True
+# Serialises microphone access between calibration and recording
+MIC_LOCK = threading.Lock()
+
+# Network I/O runs as coroutines on one background event loop so
+# translations overlap without tying up pool threads or the Qt thread
+LOOP = asyncio.new_event_loop()
+threading.Thread(target=LOOP.run_forever, name="net-loop", daemon=True).start()
+HTTP_RETRIES = 2
+HTTP_RETRY_STATUS = (502, 503, 504)
+_client = None
+
+def get_client():
+    """Shared keep-alive client; only call from coroutines on LOOP."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=10,
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+            transport=httpx.AsyncHTTPTransport(retries=HTTP_RETRIES),
+        )
+    return _client
+
+def run_async(coro):
+    """Schedule a coroutine on LOOP from any thread."""
+    return asyncio.run_coroutine_threadsafe(coro, LOOP)
+
+async def _close_client():
+    if _client is not None:
+        await _client.aclose()
+
+def close_network():
+    try:
+        run_async(_close_client()).result(timeout=2)
+    except Exception:
+        pass
+    LOOP.call_soon_threadsafe(LOOP.stop)
+
+atexit.register(close_network)
+
+# gTTS results are cached on disk so replays skip the network round trip
+TTS_CACHE_DIR = os.path.join(tempfile.gettempdir(), "ltts_cache")
+TTS_CACHE_MAX_FILES = 64
+
+# Set on shutdown so an in-progress playback wait returns immediately
+PLAYBACK_STOP = threading.Event()
+
+# Set once PortAudio is initialised; the first recording waits briefly on it
+AUDIO_READY = threading.Event()
+AUDIO_READY_WAIT = 1.5
+
+async def prewarm_session():
+    """Open the translation connection ahead of the first click."""
+    try:
+        await get_client().head(GOOGLE_TRANSLATE_URL, timeout=5)
+    except Exception:
+        pass
+
+def _prewarm():
+    """Pay first-use costs (PortAudio, DNS, TLS) before the first click."""
+    try:
+        sd.query_devices(kind="input")
+    except Exception:
+        pass
+    finally:
+        AUDIO_READY.set()
+    try:
+        socket.getaddrinfo("translate.googleapis.com", 443)
+        run_async(prewarm_session()).result(timeout=10)
+    except Exception:
+        pass
+
+_whisper_model = None
+_whisper_lock = threading.Lock()
+
+def get_whisper_model():
+    """Load the local Whisper model once; None if faster-whisper is missing."""
+    global _whisper_model
+    if WhisperModel is None:
+        return None
+    with _whisper_lock:
+        if _whisper_model is None:
+            _whisper_model = WhisperModel(WHISPER_MODEL_SIZE, device="auto", compute_type="int8")
+    return _whisper_model
+
+def _rms(frame):
+    samples = np.frombuffer(frame, dtype=np.int16).astype(np.float32)
+    return float(np.sqrt(np.dot(samples, samples) / max(len(samples), 1)))
+
+def calibrate_noise(duration=1.0):
+    """Learn the ambient noise level once instead of on every recording."""
+    try:
+        with MIC_LOCK:
+            noise = sd.rec(int(duration * VAD_SAMPLE_RATE), samplerate=VAD_SAMPLE_RATE,
+                           channels=1, dtype="int16", blocking=True)
+        RECOGNIZER.energy_threshold = _rms(noise.tobytes()) * RECOGNIZER.dynamic_energy_ratio
+    except Exception:
+        pass
+
+def prewarm_whisper():
+    """Load the model and run one silent pass so the first real click is fast."""
+    try:
+        model = get_whisper_model()
+        if model is not None:
+            segments, _ = model.transcribe(np.zeros(VAD_SAMPLE_RATE, np.float32), language="ko")
+            list(segments)
+    except Exception:
+        pass
+
+def _transcribe_local(audio, source_lang_code):
+    pcm = np.frombuffer(audio.get_raw_data(convert_rate=16000, convert_width=2), dtype=np.int16)
+    segments, _ = get_whisper_model().transcribe(
+        pcm.astype(np.float32) / 32768.0,
+        language=source_lang_code,
+        beam_size=1,
+        vad_filter=True,
+    )
+    return "".join(seg.text for seg in segments).strip()
 
 # -----------------
 # Worker functions (run in background threads)
 # -----------------
+def _listen_with_vad():
+    """Capture 20 ms frames until VAD_SILENCE_MS of silence follows speech."""
+    vad = webrtcvad.Vad(VAD_AGGRESSIVENESS) if webrtcvad is not None else None
+    r = RECOGNIZER
+    # same per-buffer damping Recognizer.listen() applies
+    damping = r.dynamic_energy_adjustment_damping ** (VAD_FRAME_MS / 1000)
+    silence_limit = VAD_SILENCE_MS // VAD_FRAME_MS
+    start_limit = VAD_START_TIMEOUT * 1000 // VAD_FRAME_MS
+    max_frames = VAD_MAX_PHRASE * 1000 // VAD_FRAME_MS
+    preroll = deque(maxlen=VAD_PREROLL_MS // VAD_FRAME_MS)
+    buf = bytearray()
+    frames = silent = 0
+    speech_started = False
+
+    frame_queue = queue.Queue()
+
+    def on_frame(indata, frame_count, time_info, status):
+        frame_queue.put(bytes(indata))
+
+    with sd.RawInputStream(samplerate=VAD_SAMPLE_RATE, channels=1, dtype="int16",
+                           blocksize=VAD_FRAME_SAMPLES, latency="low", callback=on_frame):
+        while True:
+            try:
+                frame = frame_queue.get(timeout=2)
+            except queue.Empty:
+                raise RuntimeError("No audio from microphone") from None
+            if vad is not None:
+                is_speech = vad.is_speech(frame, VAD_SAMPLE_RATE)
+            else:
+                energy = _rms(frame)
+                is_speech = energy > r.energy_threshold
+                if not speech_started and r.dynamic_energy_threshold:
+                    target = energy * r.dynamic_energy_ratio
+                    r.energy_threshold = r.energy_threshold * damping + target * (1 - damping)
+            if not speech_started:
+                if not is_speech:
+                    preroll.append(frame)
+                    frames += 1
+                    if frames >= start_limit:
+                        raise sr.WaitTimeoutError("listening timed out while waiting for phrase to start")
+                    continue
+                speech_started = True
+                frames = 0
+                for f in preroll:
+                    buf.extend(f)
+            buf.extend(frame)
+            frames += 1
+            silent = 0 if is_speech else silent + 1
+            if silent >= silence_limit or frames >= max_frames:
+                break
+    return sr.AudioData(bytes(buf), VAD_SAMPLE_RATE, 2)
+
 def do_record_and_transcribe(source_lang_code="ko"):
     """Record from microphone (single phrase) and transcribe using Google's web recognizer."""
     signals.set_status.emit("Listening...")
-    r = sr.Recognizer()
-    with sr.Microphone() as source:
-        r.adjust_for_ambient_noise(source, duration=0.5)
+    r = RECOGNIZER
+    # don't race the background PortAudio init on the first click
+    AUDIO_READY.wait(AUDIO_READY_WAIT)
+    with MIC_LOCK:
         try:
-            audio = r.listen(source, timeout=8, phrase_time_limit=12)
+            audio = _listen_with_vad()
         except Exception as e:
             signals.set_status.emit(f"Recording error: {e}")
             signals.transcription_ready.emit("")
             return
 
     signals.set_status.emit("Transcribing...")
+    if WhisperModel is not None:
+        try:
+            text = _transcribe_local(audio, source_lang_code)
+            if text:
+                signals.transcription_ready.emit(text)
+                signals.set_status.emit("Transcription done.")
+            else:
+                signals.set_status.emit("Could not understand audio.")
+                signals.transcription_ready.emit("")
+            return
+        except Exception as e:
+            signals.set_status.emit(f"Local STT failed: {e}, trying Google...")
+
     # recognizer language tag (e.g., ko-KR)
     lang_tag = RECOGNIZER_LANG_TAG.get(source_lang_code, "ko-KR")
     try:
@@ -88,28 +284,84 @@ def do_record_and_transcribe(source_lang_code="ko"):
         signals.set_status.emit(f"STT request error: {e}")
         signals.transcription_ready.emit("")
 
-def do_translate(text, source_code, target_code):
+async def _get_json(url, params):
+    """GET url and parse JSON, retrying briefly on gateway errors."""
+    client = get_client()
+    for attempt in range(HTTP_RETRIES + 1):
+        resp = await client.get(url, params=params)
+        if resp.status_code not in HTTP_RETRY_STATUS or attempt == HTTP_RETRIES:
+            break
+        await asyncio.sleep(0.2 * 2 ** attempt)
+    resp.raise_for_status()
+    return json_loads(resp.content)
+
+async def _google_translate(text, source_code, target_code):
+    """Translate one query via Google, joining every returned segment."""
+    params = [
+        ("client", "gtx"),
+        ("sl", source_code),
+        ("tl", target_code),
+        ("dt", "t"),
+        ("q", text),
+    ]
+    data = await _get_json(GOOGLE_TRANSLATE_URL, params)
+    return "".join(seg[0] for seg in data[0] if seg and seg[0])
+
+async def _mymemory_translate(text, source_code, target_code):
+    params = {
+        "q": text,
+        "langpair": f"{source_code}|{target_code}"
+    }
+    data = await _get_json(MYMEMORY_URL, params)
+    return data.get("responseData", {}).get("translatedText", "")
+
+def _split_long_text(text, limit=LONG_TEXT_CHUNK):
+    """Cut text into chunks of at most limit chars, preferring sentence ends."""
+    chunks, current = [], ""
+    for sentence in SENTENCE_RE.findall(text):
+        while len(sentence) > limit:
+            # no sentence break in sight; hard-cut the run-on
+            chunks.append(current + sentence[:limit - len(current)])
+            sentence = sentence[limit - len(current):]
+            current = ""
+        if len(current) + len(sentence) > limit:
+            chunks.append(current)
+            current = ""
+        current += sentence
+    if current.strip():
+        chunks.append(current)
+    return [c for c in chunks if c.strip()]
+
+async def _google_translate_long(text, source_code, target_code):
+    """Translate one long text as parallel sentence-aligned chunks."""
+    chunks = _split_long_text(text)
+    if len(chunks) <= 1:
+        return await _google_translate(text, source_code, target_code)
+    parts = await asyncio.gather(
+        *(_google_translate(c, source_code, target_code) for c in chunks))
+    # Keep line breaks between chunks; otherwise a space, except for
+    # scripts that don't put spaces between sentences
+    space = "" if target_code.split("-")[0].lower() in UNSPACED_TARGETS else " "
+    out = []
+    for chunk, part in zip(chunks, parts):
+        if part:
+            out.append(part.strip())
+            out.append("\n" if "\n" in chunk[len(chunk.rstrip()):] else space)
+    return "".join(out[:-1])
+
+async def do_translate(text, source_code, target_code):
+    """Translate text and emit the result."""
     signals.set_status.emit("Translating...")
     if not text:
         signals.set_status.emit("Nothing to translate.")
-        signals.translation_ready.emit("")
+        signals.translation_ready.emit("", target_code)
         return
     
     # Try Google Translate first
     try:
-        params = {
-            "client": "gtx",
-            "sl": source_code,
-            "tl": target_code,
-            "dt": "t",
-            "q": text
-        }
-        resp = requests.get(GOOGLE_TRANSLATE_URL, params=params, timeout=10)
-        resp.raise_for_status()
-        data = resp.json()
-        if data and len(data) > 0 and len(data[0]) > 0:
-            translated = data[0][0][0]
-            signals.translation_ready.emit(translated)
+        translated = await _google_translate_long(text, source_code, target_code)
+        if translated:
+            signals.translation_ready.emit(translated, target_code)
             signals.set_status.emit("Translation done.")
             return
     except Exception as e:
@@ -117,23 +369,109 @@ def do_translate(text, source_code, target_code):
     
     # Fallback to MyMemory API
     try:
-        params = {
-            "q": text,
-            "langpair": f"{source_code}|{target_code}"
-        }
-        resp = requests.get(MYMEMORY_URL, params=params, timeout=10)
-        resp.raise_for_status()
-        data = resp.json()
-        translated = data.get("responseData", {}).get("translatedText", "")
+        translated = await _mymemory_translate(text, source_code, target_code)
         if translated:
-            signals.translation_ready.emit(translated)
+            signals.translation_ready.emit(translated, target_code)
             signals.set_status.emit("Translation done.")
         else:
             signals.set_status.emit("Translation failed.")
-            signals.translation_ready.emit("")
+            signals.translation_ready.emit("", target_code)
     except Exception as e:
         signals.set_status.emit(f"Translation error: {e}")
-        signals.translation_ready.emit("")
+        signals.translation_ready.emit("", target_code)
+
+def _tts_cache_path(text, target_code):
+    key = hashlib.sha256(f"{target_code}|{text}".encode("utf-8")).hexdigest()
+    return os.path.join(TTS_CACHE_DIR, key + ".mp3")
+
+def _prune_tts_cache():
+    """Drop the least recently used files once the cache grows past its cap."""
+    try:
+        entries = [e for e in os.scandir(TTS_CACHE_DIR) if e.name.endswith(".mp3")]
+    except OSError:
+        return
+    if len(entries) <= TTS_CACHE_MAX_FILES:
+        return
+    entries.sort(key=lambda e: e.stat().st_atime)
+    for entry in entries[:len(entries) - TTS_CACHE_MAX_FILES]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+def _store_tts_cache(path, data):
+    """Atomically write synthesized MP3 bytes into the cache."""
+    os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=TTS_CACHE_DIR, suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    _prune_tts_cache()
+
+# cache path -> Future for syntheses still in flight, so a Play click
+# arriving during a prefetch waits for it instead of synthesizing twice
+_tts_inflight = {}
+_tts_inflight_lock = threading.Lock()
+
+def get_tts_audio(text, target_code, store=False):
+    """Return (mp3_bytes, cache_path, cached) for text, synthesizing on a miss.
+
+    With store=True a fresh synthesis is written to the cache before returning.
+    """
+    path = _tts_cache_path(text, target_code)
+    try:
+        with open(path, "rb") as f:
+            return f.read(), path, True
+    except FileNotFoundError:
+        pass
+
+    with _tts_inflight_lock:
+        future = _tts_inflight.get(path)
+        owner = future is None
+        if owner:
+            future = _tts_inflight[path] = Future()
+    if not owner:
+        # the owner reports whether it already wrote the cache file
+        data, cached = future.result()
+        return data, path, cached
+
+    try:
+        # gTTS language uses short ISO codes (en, ko, vi, ...)
+        buf = io.BytesIO()
+        gTTS(text=text, lang=target_code).write_to_fp(buf)
+        data = buf.getvalue()
+        cached = False
+        if store:
+            try:
+                _store_tts_cache(path, data)
+                cached = True
+            except OSError:
+                pass  # still playable from memory; a later call retries the write
+        future.set_result((data, cached))
+        return data, path, cached
+    except Exception as e:
+        if not future.done():
+            future.set_exception(e)
+        raise
+    finally:
+        with _tts_inflight_lock:
+            _tts_inflight.pop(path, None)
+
+def prefetch_tts(text, target_code):
+    """Synthesize a translation into the replay cache before Play is clicked."""
+    if not text:
+        return
+    try:
+        get_tts_audio(text, target_code, store=True)
+    except Exception:
+        pass  # do_tts_play retries and reports the error if the user plays
 
 def do_tts_play(text, target_code):
     if not text:
@@ -141,128 +479,75 @@ def do_tts_play(text, target_code):
         return
     signals.set_status.emit("Generating speech...")
     try:
-        # gTTS language uses short ISO codes (en, ko, vi, ...)
-        tts = gTTS(text=text, lang=target_code)
-        tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".mp3")
-        tmp.close()
-        tts.save(tmp.name)
+        data, cache_path, cached = get_tts_audio(text, target_code)
         signals.set_status.emit("Playing audio...")
         
-        # Initialize pygame mixer and play the audio
-        pygame.mixer.init()
-        pygame.mixer.music.load(tmp.name)
-        pygame.mixer.music.play()
+        # Play straight from memory (mixer is initialised once by MainWindow)
+        try:
+            sound = pygame.mixer.Sound(file=io.BytesIO(data))
+        except (TypeError, pygame.error):
+            # older pygame builds can only load from a path
+            if not cached:
+                _store_tts_cache(cache_path, data)
+                cached = True
+            sound = pygame.mixer.Sound(cache_path)
+        sound.play()
         
-        # Wait for the music to finish playing
-        while pygame.mixer.music.get_busy():
-            pygame.time.wait(100)
+        # Persist to the replay cache while the audio is already playing
+        if not cached:
+            try:
+                _store_tts_cache(cache_path, data)
+            except OSError:
+                pass
+        
+        # Block for exactly the clip length instead of polling get_busy()
+        if PLAYBACK_STOP.wait(sound.get_length()):
+            sound.stop()
         
-        try:
-            os.remove(tmp.name)
-        except:
-            pass
         signals.set_status.emit("Done.")
     except Exception as e:
         signals.set_status.emit(f"TTS error: {e}")
 
 # -----------------
-# Main Window
+# Backend for the shared window
 # -----------------
-class MainWindow(QWidget):
+class LiveBackend(Backend):
     def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Korean → Multilang Speech Translator (MCP)")
-        self.setMinimumSize(600, 480)
-        layout = QVBoxLayout()
-
-        # status
-        self.status_label = QLabel("Ready")
-        layout.addWidget(self.status_label)
-
-        # controls: target language selector + buttons
-        controls = QHBoxLayout()
-        self.lang_box = QComboBox()
-        for name in LANGS.keys():
-            if name == "Korean":
-                continue  # target shouldn't be Korean by default
-            self.lang_box.addItem(name)
-        controls.addWidget(QLabel("Target:"))
-        controls.addWidget(self.lang_box)
-
-        self.record_button = QPushButton("Record (Korean)")
-        self.record_button.clicked.connect(self.on_record_clicked)
-        controls.addWidget(self.record_button)
-
-        self.play_button = QPushButton("Play Translation")
-        self.play_button.clicked.connect(self.on_play_clicked)
-        controls.addWidget(self.play_button)
-
-        layout.addLayout(controls)
-
-        # text areas
-        layout.addWidget(QLabel("Recognized (Korean):"))
-        self.orig_text = QTextEdit()
-        self.orig_text.setReadOnly(False)
-        layout.addWidget(self.orig_text)
-
-        layout.addWidget(QLabel("Translated:"))
-        self.trans_text = QTextEdit()
-        self.trans_text.setReadOnly(True)
-        layout.addWidget(self.trans_text)
-
-        self.setLayout(layout)
-
-        # wire signals
-        signals.transcription_ready.connect(self.on_transcription_ready)
-        signals.translation_ready.connect(self.on_translation_ready)
-        signals.set_status.connect(self.on_status)
-
-    def on_status(self, s):
-        self.status_label.setText(s)
-
-    def on_record_clicked(self):
-        # disable button while recording
-        self.record_button.setEnabled(False)
-        self.status_label.setText("Starting...")
-        # Record & transcribe in background
-        t = threading.Thread(target=self.background_record_and_translate, daemon=True)
-        t.start()
-
-    def background_record_and_translate(self):
-        # 1) STT (assume source = Korean)
+        threading.Thread(target=_prewarm, daemon=True).start()
+        QThreadPool.globalInstance().start(Task(calibrate_noise))
+        # open the audio device once; gTTS produces 24 kHz mono MP3
+        if not pygame.mixer.get_init():
+            pygame.mixer.init(frequency=24000, size=-16, channels=1, buffer=512)
+            atexit.register(pygame.mixer.quit)
+            atexit.register(PLAYBACK_STOP.set)
+
+    def record(self):
+        # source is always Korean
         do_record_and_transcribe(source_lang_code="ko")
-        # transcription_ready signal will trigger translation below
-
-    def on_transcription_ready(self, text):
-        self.orig_text.setPlainText(text)
-        # after transcription, call translation
-        target_name = self.lang_box.currentText()
-        target_code = LANGS.get(target_name, "en")
-        # run translation in background thread
-        t = threading.Thread(target=do_translate, args=(text, "ko", target_code), daemon=True)
-        t.start()
-        # re-enable record button
-        self.record_button.setEnabled(True)
-
-    def on_translation_ready(self, translated):
-        self.trans_text.setPlainText(translated)
-
-    def on_play_clicked(self):
-        translated = self.trans_text.toPlainText().strip()
-        if not translated:
-            self.status_label.setText("No translated text to play.")
-            return
-        target_name = self.lang_box.currentText()
-        target_code = LANGS.get(target_name, "en")
-        t = threading.Thread(target=do_tts_play, args=(translated, target_code), daemon=True)
-        t.start()
+
+    def translate(self, text, target_code):
+        # runs on the network loop; returns without holding a pool thread
+        run_async(do_translate(text, "ko", target_code))
+
+    def tts(self, text, target_code):
+        do_tts_play(text, target_code)
+
+    def prefetch(self, text, target_code):
+        prefetch_tts(text, target_code)
+
+class LiveWindow(MainWindow):
+    """The live app keeps its editable Korean box and labelled buttons."""
+    SOURCE_EDITABLE = True
+    PLAY_LABEL = "▶️ Play Translation"
+    RECORD_LABEL = "Record (Korean)"
 
 # -----------------
 # Run
 # -----------------
 def main():
     app = QApplication(sys.argv)
-    w = MainWindow()
+    threading.Thread(target=prewarm_whisper, daemon=True).start()
+    w = LiveWindow(LiveBackend())
     w.show()
     sys.exit(app.exec_())
 
@@ -10,66 +10,358 @@ import uuid
 import threading
 import time
 import json
-from flask import Flask, render_template_string, request, jsonify, send_from_directory
+import heapq
+import functools
+import math
+import hashlib
+import atexit
+import shutil
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from flask import Flask, Request, render_template_string, request, send_from_directory
 from werkzeug.utils import secure_filename
 import tempfile
 import soundfile as sf
 import numpy as np
 from multi_device_audio import AudioDeviceManager
 
+try:
+    from waitress import serve
+except ImportError:
+    serve = None  # fall back to Flask's development server
+
+try:
+    import orjson
+
+    loads = orjson.loads
+
+    def dumps(obj):
+        # device indexes are used as dict keys, which orjson rejects by default
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    loads = json.loads
+
+    def dumps(obj):
+        return json.dumps(obj)
+
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1MB reads when streaming raw uploads
+
+
+class DiskSpooledRequest(Request):
+    """Spool multipart file parts straight to disk instead of buffering small ones in RAM."""
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return tempfile.TemporaryFile('wb+')
+
+
 app = Flask(__name__)
+app.request_class = DiskSpooledRequest
 app.config['MAX_CONTENT_LENGTH'] = 100 * 1024 * 1024  # 100MB max file size
 
+PLAYBACK_TTL = 600  # Seconds before a session's temp files are removed
+
+
+class PlaybackRegistry:
+    """Active playback sessions, plus a heap of expiry times for cleanup.
+
+    Supports the dict operations the endpoints use. Writers replace the
+    session dict with an updated copy under the lock; readers just grab the
+    current dict, so status polling never waits on a writer and never sees
+    a dict that is changing size under iteration.
+    """
+
+    def __init__(self, ttl, on_change=None):
+        self.ttl = ttl
+        self.on_change = on_change  # called after the session table changes
+        self._sessions = {}
+        self._expiry = []  # (monotonic deadline, playback_id)
+        self._cond = threading.Condition()
+
+    def __setitem__(self, playback_id, info):
+        with self._cond:
+            sessions = dict(self._sessions)
+            sessions[playback_id] = info
+            self._sessions = sessions
+            heapq.heappush(self._expiry, (time.monotonic() + self.ttl, playback_id))
+            self._cond.notify()
+        self._changed()
+
+    def __getitem__(self, playback_id):
+        return self._sessions[playback_id]
+
+    def __contains__(self, playback_id):
+        return playback_id in self._sessions
+
+    def get(self, playback_id, default=None):
+        return self._sessions.get(playback_id, default)
+
+    def pop(self, playback_id, default=None):
+        with self._cond:
+            if playback_id not in self._sessions:
+                return default
+            sessions = dict(self._sessions)
+            info = sessions.pop(playback_id)
+            self._sessions = sessions
+        self._changed()
+        return info
+
+    def keys(self):
+        return list(self._sessions)
+
+    def drain(self):
+        """Swap in an empty table and return the old sessions for cleanup."""
+        with self._cond:
+            sessions, self._sessions = self._sessions, {}
+        self._changed()
+        return sessions
+
+    def values(self):
+        return list(self._sessions.values())
+
+    def wait_expired(self):
+        """Block until at least one session expires, then remove and return them."""
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                expired = []
+                sessions = self._sessions
+                while self._expiry and self._expiry[0][0] <= now:
+                    _, playback_id = heapq.heappop(self._expiry)
+                    if playback_id in sessions:  # skip sessions already stopped
+                        if sessions is self._sessions:
+                            sessions = dict(sessions)
+                        expired.append(sessions.pop(playback_id))
+                if expired:
+                    self._sessions = sessions
+                    break
+                timeout = self._expiry[0][0] - now if self._expiry else None
+                self._cond.wait(timeout)
+        self._changed()
+        return expired
+
+    def _changed(self):
+        if self.on_change is not None:
+            self.on_change()
+
+
+class StatusChanges:
+    """Version counter bumped on every playback status change.
+
+    Event streams block in wait() until the version moves on instead of
+    rebuilding the status on a timer.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self._cond = threading.Condition()
+
+    def notify(self):
+        with self._cond:
+            self.version += 1
+            self._cond.notify_all()
+
+    def wait(self, seen, timeout):
+        """Return the current version once it differs from seen, or after timeout."""
+        with self._cond:
+            self._cond.wait_for(lambda: self.version != seen, timeout)
+            return self.version
+
+
+# The UI page never changes while the server runs, so read and hash it once
+INDEX_HTML_PATH = os.path.join(os.path.dirname(__file__), 'web_ui.html')
+with open(INDEX_HTML_PATH, 'rb') as f:
+    INDEX_HTML = f.read()
+INDEX_ETAG = hashlib.md5(INDEX_HTML).hexdigest()
+
+class TempFilePool:
+    """Reusable temp files for uploads, so each upload skips create/unlink.
+
+    Files live in a private directory and are handed out by extension (the
+    audio loader still sees the right suffix). Released files are truncated
+    and kept for reuse up to max_free; any beyond that are deleted.
+    """
+
+    def __init__(self, max_free=32):
+        self.dir = tempfile.mkdtemp(prefix='leaudio_uploads_')
+        self.max_free = max_free
+        self._free = {}  # suffix -> [path, ...]
+        self._free_count = 0
+        self._lock = threading.Lock()
+        atexit.register(shutil.rmtree, self.dir, True)
+
+    def acquire(self, suffix=''):
+        with self._lock:
+            paths = self._free.get(suffix)
+            if paths:
+                self._free_count -= 1
+                return paths.pop()
+        fd, path = tempfile.mkstemp(suffix=suffix, dir=self.dir)
+        os.close(fd)
+        return path
+
+    def release(self, path):
+        try:
+            with self._lock:
+                if self._free_count < self.max_free:
+                    os.truncate(path, 0)
+                    self._free.setdefault(os.path.splitext(path)[1], []).append(path)
+                    self._free_count += 1
+                    return
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+upload_files = TempFilePool()
+
 # Global audio manager
+status_changes = StatusChanges()
 audio_manager = AudioDeviceManager()
-active_playbacks = {}  # Track active playback sessions
+audio_manager.on_status_change = status_changes.notify
+active_playbacks = PlaybackRegistry(PLAYBACK_TTL, on_change=status_changes.notify)  # Track active playback sessions
+# Decodes uploaded files in parallel (libsndfile releases the GIL)
+LOAD_POOL = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+
+# Device enumeration is slow and the UI polls it, so keep the last result briefly
+DEVICE_CACHE_TTL = 2.0
+_device_cache = {'ts': 0.0, 'body': None}
+_device_cache_lock = threading.Lock()
+
+
+def json_response(payload, status=200):
+    """Build a JSON response from a dict or an already-serialized body."""
+    body = payload if isinstance(payload, (bytes, str)) else dumps(payload)
+    return app.response_class(body, status=status, mimetype='application/json')
+
+
+def _error_body(message):
+    return dumps({'success': False, 'error': message})
+
+
+def error_response(message, status=500):
+    """Standard {"success": false, "error": ...} reply."""
+    return json_response(_error_body(message), status)
+
+
+# Fixed error replies are serialized once at import
+NO_FILE_PROVIDED = _error_body('No file provided')
+NO_FILE_SELECTED = _error_body('No file selected')
+INVALID_FILE_TYPE = _error_body('Invalid file type')
+DEVICE_ID_REQUIRED = _error_body('Device ID is required')
+NO_FILES_PROVIDED = _error_body('No files provided')
+NO_FILES_SELECTED = _error_body('No files selected')
+INVALID_MAPPINGS = _error_body('Invalid device mappings format')
+MAPPING_COUNT_MISMATCH = _error_body('Number of files must match number of device mappings')
+NO_VALID_MAPPINGS = _error_body('No valid file-device mappings')
+INVALID_TEST_TONE = _error_body('Frequency must be between 20 and 20000 Hz')
+FILE_TOO_LARGE = _error_body('File too large. Maximum size is 100MB.')
+ENDPOINT_NOT_FOUND = _error_body('Endpoint not found')
+INTERNAL_ERROR = _error_body('Internal server error')
+
+
+# Temp files are released on a background thread so slow filesystems
+# never hold up an HTTP response
+_release_queue = queue.Queue()
+
+
+def _release_worker():
+    while True:
+        path = _release_queue.get()
+        try:
+            upload_files.release(path)
+        except OSError as file_error:
+            print(f"Error cleaning up file {path}: {file_error}")
+
+
+threading.Thread(target=_release_worker, name='temp-file-release', daemon=True).start()
+
+
+def release_upload(path):
+    """Queue a temp file to be returned to the pool."""
+    _release_queue.put(path)
+
+
+def remove_playback_files(info):
+    """Delete the temp file(s) recorded for a playback session."""
+    paths = info.get('file_paths') or [info.get('file_path')]
+    for path in filter(None, paths):
+        release_upload(path)
+
+
+def discard_playback(playback_id):
+    """Forget a playback session and delete its temp file(s)."""
+    info = active_playbacks.pop(playback_id, None)
+    if info is not None:
+        remove_playback_files(info)
+
+
+ALLOWED_EXTENSIONS = frozenset(('wav', 'mp3', 'flac', 'ogg', 'm4a', 'aac', 'wma'))
 
 
 def allowed_file(filename):
     """Check if file extension is allowed."""
-    ALLOWED_EXTENSIONS = {'wav', 'mp3', 'flac', 'ogg', 'm4a', 'aac', 'wma'}
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    dot = filename.rfind('.')
+    return dot >= 0 and filename[dot + 1:].lower() in ALLOWED_EXTENSIONS
 
 
 @app.route('/')
 def index():
-    """Serve the main HTML page."""
-    html_file = os.path.join(os.path.dirname(__file__), 'web_ui.html')
-    with open(html_file, 'r', encoding='utf-8') as f:
-        html_content = f.read()
-    return html_content
+    """Serve the main HTML page (304 when the browser already has it)."""
+    response = app.response_class(INDEX_HTML, mimetype='text/html')
+    response.set_etag(INDEX_ETAG)
+    response.headers['Cache-Control'] = 'public, max-age=60'
+    return response.make_conditional(request)
+
+
+def _device_list_body():
+    """Return the serialized /api/devices payload, re-enumerating once it is stale."""
+    with _device_cache_lock:
+        now = time.monotonic()
+        if _device_cache['body'] is None or now - _device_cache['ts'] >= DEVICE_CACHE_TTL:
+            devices = audio_manager.discover_devices()
+            device_list = []
+            
+            for device in devices:
+                device_info = {
+                    'index': device.index,
+                    'name': device.name,
+                    'max_input_channels': device.max_input_channels,
+                    'max_output_channels': device.max_output_channels,
+                    'default_samplerate': device.default_samplerate,
+                    'is_default': device.is_default,
+                    'status': 'idle'
+                }
+                device_list.append(device_info)
+            
+            _device_cache['body'] = dumps({
+                'success': True,
+                'devices': device_list,
+                'count': len(device_list)
+            })
+            _device_cache['ts'] = now
+        return _device_cache['body']
 
 
 @app.route('/api/devices', methods=['GET'])
 def get_devices():
     """Get list of available audio devices."""
     try:
-        devices = audio_manager.discover_devices()
-        device_list = []
-        
-        for device in devices:
-            device_info = {
-                'index': device.index,
-                'name': device.name,
-                'max_input_channels': device.max_input_channels,
-                'max_output_channels': device.max_output_channels,
-                'default_samplerate': device.default_samplerate,
-                'is_default': device.is_default,
-                'status': 'idle'
-            }
-            device_list.append(device_info)
-        
-        return jsonify({
-            'success': True,
-            'devices': device_list,
-            'count': len(device_list)
-        })
+        return json_response(_device_list_body())
+    
+    except Exception as e:
+        return error_response(str(e))
+
+
+@app.route('/api/devices/rescan', methods=['POST'])
+def rescan_devices():
+    """Drop the cached device list and enumerate again."""
+    try:
+        with _device_cache_lock:
+            _device_cache['body'] = None
+        return json_response(_device_list_body())
     
     except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        return error_response(str(e))
 
 
 @app.route('/api/test-device', methods=['POST'])
@@ -80,25 +372,33 @@ def test_device():
         device_id = data.get('device_id')
         
         if device_id is None:
-            return jsonify({
-                'success': False,
-                'error': 'Device ID is required'
-            }), 400
+            return json_response(DEVICE_ID_REQUIRED, 400)
         
         # Test the device
         success = audio_manager.test_device(device_id)
         
-        return jsonify({
+        return json_response({
             'success': success,
             'device_id': device_id,
             'message': 'Test passed' if success else 'Test failed'
         })
     
     except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        return error_response(str(e))
+
+
+# Test tones are cached, so keep the client-chosen parameters bounded
+TEST_TONE_MAX_DURATION = 10.0
+TEST_TONE_MIN_FREQUENCY = 20.0
+TEST_TONE_MAX_FREQUENCY = 20000.0
+
+
+@functools.lru_cache(maxsize=8)
+def render_test_tone(duration, frequency):
+    """Build a test tone once per (duration, frequency); the array is shared read-only."""
+    test_tone, sample_rate = audio_manager.create_test_tone(duration, frequency)
+    test_tone.setflags(write=False)
+    return test_tone, sample_rate
 
 
 @app.route('/api/test-tone', methods=['POST'])
@@ -106,47 +406,31 @@ def play_test_tone():
     """Play test tone on all devices."""
     try:
         data = request.get_json()
-        duration = data.get('duration', 2.0)
-        frequency = data.get('frequency', 440.0)
-        
-        # Create test tone
-        test_tone, sample_rate = audio_manager.create_test_tone(duration, frequency)
-        
-        # Save to temporary file
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-            sf.write(tmp_file.name, test_tone, sample_rate)
-            temp_file_path = tmp_file.name
-        
-        try:
-            # Play on all devices
-            results = audio_manager.play_on_all_devices(temp_file_path)
-            
-            if results:
-                successful_devices = sum(results.values())
-                return jsonify({
-                    'success': True,
-                    'devices_playing': successful_devices,
-                    'total_devices': len(results),
-                    'message': f'Test tone playing on {successful_devices} devices'
-                })
-            else:
-                return jsonify({
-                    'success': False,
-                    'error': 'Failed to play test tone on any device'
-                })
-        
-        finally:
-            # Clean up temp file
-            try:
-                os.unlink(temp_file_path)
-            except:
-                pass
+        duration = float(data.get('duration', 2.0))
+        frequency = float(data.get('frequency', 440.0))
+        if not (math.isfinite(frequency) and TEST_TONE_MIN_FREQUENCY <= frequency <= TEST_TONE_MAX_FREQUENCY):
+            return json_response(INVALID_TEST_TONE, 400)
+        if not math.isfinite(duration):
+            duration = 2.0
+        duration = min(max(duration, 0.1), TEST_TONE_MAX_DURATION)
+        
+        # Create (or reuse) the test tone and play it straight from memory
+        test_tone, sample_rate = render_test_tone(duration, frequency)
+        results = audio_manager.play_array_on_all_devices(test_tone, sample_rate)
+        
+        if results:
+            successful_devices = sum(results.values())
+            return json_response({
+                'success': True,
+                'devices_playing': successful_devices,
+                'total_devices': len(results),
+                'message': f'Test tone playing on {successful_devices} devices'
+            })
+        else:
+            return error_response('Failed to play test tone on any device', 200)
     
     except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        return error_response(str(e))
 
 
 @app.route('/api/play-device', methods=['POST'])
@@ -154,37 +438,24 @@ def play_on_device():
     """Play audio file on a specific device."""
     try:
         if 'file' not in request.files:
-            return jsonify({
-                'success': False,
-                'error': 'No file provided'
-            }), 400
+            return json_response(NO_FILE_PROVIDED, 400)
         
         file = request.files['file']
         device_id = request.form.get('device_id')
         
         if not file or file.filename == '':
-            return jsonify({
-                'success': False,
-                'error': 'No file selected'
-            }), 400
+            return json_response(NO_FILE_SELECTED, 400)
         
         if not allowed_file(file.filename):
-            return jsonify({
-                'success': False,
-                'error': 'Invalid file type'
-            }), 400
+            return json_response(INVALID_FILE_TYPE, 400)
         
         if not device_id:
-            return jsonify({
-                'success': False,
-                'error': 'Device ID is required'
-            }), 400
+            return json_response(DEVICE_ID_REQUIRED, 400)
         
         # Save uploaded file temporarily
         filename = secure_filename(file.filename)
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(filename)[1]) as tmp_file:
-            file.save(tmp_file.name)
-            temp_file_path = tmp_file.name
+        temp_file_path = upload_files.acquire(os.path.splitext(filename)[1])
+        file.save(temp_file_path)
         
         try:
             # Load audio file
@@ -194,29 +465,70 @@ def play_on_device():
             success = audio_manager.play_on_device(int(device_id), audio_data, sample_rate)
             
             if success:
-                return jsonify({
+                return json_response({
                     'success': True,
                     'device_id': device_id,
                     'message': f'Playing on device {device_id}'
                 })
             else:
-                return jsonify({
-                    'success': False,
-                    'error': f'Failed to play on device {device_id}'
+                return error_response(f'Failed to play on device {device_id}', 200)
+        
+        finally:
+            # Return the temp file to the pool
+            release_upload(temp_file_path)
+    
+    except Exception as e:
+        return error_response(str(e))
+
+
+@app.route('/api/play-device-stream', methods=['POST'])
+def play_on_device_stream():
+    """Play a raw (non-multipart) request body on a specific device.
+
+    The device is given as ?device_id=N and the original name as ?filename=...
+    so the body can be copied to disk in chunks without form parsing.
+    """
+    try:
+        device_id = request.args.get('device_id')
+        filename = secure_filename(request.args.get('filename', 'upload.wav'))
+        
+        if not device_id:
+            return json_response(DEVICE_ID_REQUIRED, 400)
+        
+        if not allowed_file(filename):
+            return json_response(INVALID_FILE_TYPE, 400)
+        
+        # Copy the body to disk as it arrives
+        temp_file_path = upload_files.acquire(os.path.splitext(filename)[1])
+        with open(temp_file_path, 'wb') as tmp_file:
+            while chunk := request.stream.read(UPLOAD_CHUNK_SIZE):
+                tmp_file.write(chunk)
+        
+        try:
+            if os.path.getsize(temp_file_path) == 0:
+                return json_response(NO_FILE_PROVIDED, 400)
+            
+            # Load audio file
+            audio_data, sample_rate = audio_manager.load_audio_file(temp_file_path)
+            
+            # Play on specific device
+            success = audio_manager.play_on_device(int(device_id), audio_data, sample_rate)
+            
+            if success:
+                return json_response({
+                    'success': True,
+                    'device_id': device_id,
+                    'message': f'Playing on device {device_id}'
                 })
+            else:
+                return error_response(f'Failed to play on device {device_id}', 200)
         
         finally:
-            # Clean up temp file
-            try:
-                os.unlink(temp_file_path)
-            except:
-                pass
+            # Return the temp file to the pool
+            release_upload(temp_file_path)
     
     except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        return error_response(str(e))
 
 
 @app.route('/api/play-all', methods=['POST'])
@@ -224,31 +536,21 @@ def play_all_devices():
     """Play audio file on all devices."""
     try:
         if 'file' not in request.files:
-            return jsonify({
-                'success': False,
-                'error': 'No file provided'
-            }), 400
+            return json_response(NO_FILE_PROVIDED, 400)
         
         file = request.files['file']
         play_all = request.form.get('play_all', 'true').lower() == 'true'
         
         if not file or file.filename == '':
-            return jsonify({
-                'success': False,
-                'error': 'No file selected'
-            }), 400
+            return json_response(NO_FILE_SELECTED, 400)
         
         if not allowed_file(file.filename):
-            return jsonify({
-                'success': False,
-                'error': 'Invalid file type'
-            }), 400
+            return json_response(INVALID_FILE_TYPE, 400)
         
         # Save uploaded file temporarily
         filename = secure_filename(file.filename)
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(filename)[1]) as tmp_file:
-            file.save(tmp_file.name)
-            temp_file_path = tmp_file.name
+        temp_file_path = upload_files.acquire(os.path.splitext(filename)[1])
+        file.save(temp_file_path)
         
         try:
             # Generate unique playback ID
@@ -268,7 +570,7 @@ def play_all_devices():
                     'devices_playing': successful_devices
                 }
                 
-                return jsonify({
+                return json_response({
                     'success': True,
                     'playback_id': playback_id,
                     'devices_playing': successful_devices,
@@ -276,22 +578,13 @@ def play_all_devices():
                     'message': f'Playing on {successful_devices} devices'
                 })
             else:
-                return jsonify({
-                    'success': False,
-                    'error': 'Failed to play on any device'
-                })
+                return error_response('Failed to play on any device', 200)
         
         except Exception as e:
-            return jsonify({
-                'success': False,
-                'error': str(e)
-            }), 500
+            return error_response(str(e))
     
     except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        return error_response(str(e))
 
 
 @app.route('/api/stop-playback', methods=['POST'])
@@ -304,39 +597,22 @@ def stop_playback():
         # Stop all playback
         audio_manager.stop_all_playback()
         
-        # Clean up playback info
-        if playback_id and playback_id in active_playbacks:
-            playback_info = active_playbacks[playback_id]
-            # Clean up temp file
-            try:
-                if os.path.exists(playback_info['file_path']):
-                    os.unlink(playback_info['file_path'])
-            except:
-                pass
-            del active_playbacks[playback_id]
-        
-        # Clean up all temp files from active playbacks
-        playback_ids_to_remove = list(active_playbacks.keys())
-        for pid in playback_ids_to_remove:
-            if pid in active_playbacks:
-                info = active_playbacks[pid]
-                try:
-                    if os.path.exists(info['file_path']):
-                        os.unlink(info['file_path'])
-                except:
-                    pass
-                del active_playbacks[pid]
-        
-        return jsonify({
+        # Clean up only the requested session; old ones expire in cleanup_temp_files
+        if playback_id:
+            discard_playback(playback_id)
+        
+        # {"full": true} clears every session's temp files as well
+        if data.get('full'):
+            for info in active_playbacks.drain().values():
+                remove_playback_files(info)
+        
+        return json_response({
             'success': True,
             'message': 'Playback stopped'
         })
     
     except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        return error_response(str(e))
 
 
 @app.route('/api/force-stop', methods=['POST'])
@@ -352,46 +628,21 @@ def force_stop():
             print(f"Error stopping audio manager: {audio_error}")
             # Continue with cleanup even if audio manager fails
         
-        # Clear all active playbacks safely
-        playback_ids_to_clear = list(active_playbacks.keys())
-        for pid in playback_ids_to_clear:
+        # Clear all active playbacks in one swap, then clean up the old ones
+        for pid, playback_info in active_playbacks.drain().items():
             try:
-                if pid in active_playbacks:
-                    playback_info = active_playbacks[pid]
-                    
-                    # Clean up temporary files
-                    if 'file_paths' in playback_info:
-                        for file_path in playback_info['file_paths']:
-                            try:
-                                if os.path.exists(file_path):
-                                    os.unlink(file_path)
-                            except Exception as file_error:
-                                print(f"Error cleaning up file {file_path}: {file_error}")
-                    elif 'file_path' in playback_info:
-                        try:
-                            if os.path.exists(playback_info['file_path']):
-                                os.unlink(playback_info['file_path'])
-                        except Exception as file_error:
-                            print(f"Error cleaning up file {playback_info['file_path']}: {file_error}")
-                    
-                    del active_playbacks[pid]
+                remove_playback_files(playback_info)
             except Exception as cleanup_error:
                 print(f"Error cleaning up playback {pid}: {cleanup_error}")
-                # Still try to remove it
-                if pid in active_playbacks:
-                    del active_playbacks[pid]
         
-        return jsonify({
+        return json_response({
             'success': True,
             'message': 'All playback force stopped'
         })
     
     except Exception as e:
         print(f"Error in force stop: {e}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        return error_response(str(e))
 
 
 @app.route('/api/play-multi-files', methods=['POST'])
@@ -399,33 +650,26 @@ def play_multi_files():
     """Play different audio files on different devices."""
     try:
         if 'files' not in request.files:
-            return jsonify({
-                'success': False,
-                'error': 'No files provided'
-            }), 400
+            return json_response(NO_FILES_PROVIDED, 400)
         
         files = request.files.getlist('files')
         device_mappings = request.form.get('device_mappings', '{}')
         
         if not files:
-            return jsonify({
-                'success': False,
-                'error': 'No files selected'
-            }), 400
+            return json_response(NO_FILES_SELECTED, 400)
         
+        # Either a list of device ids by file position, or the older
+        # {"0": device_id, ...} object
         try:
-            mappings = json.loads(device_mappings)
-        except json.JSONDecodeError:
-            return jsonify({
-                'success': False,
-                'error': 'Invalid device mappings format'
-            }), 400
+            mappings = loads(device_mappings)
+        except json.JSONDecodeError:  # orjson's error subclasses this
+            return json_response(INVALID_MAPPINGS, 400)
+        if not isinstance(mappings, (list, dict)):
+            return json_response(INVALID_MAPPINGS, 400)
+        by_position = isinstance(mappings, list)
         
         if len(files) != len(mappings):
-            return jsonify({
-                'success': False,
-                'error': 'Number of files must match number of device mappings'
-            }), 400
+            return json_response(MAPPING_COUNT_MISMATCH, 400)
         
         # Validate files and device mappings
         temp_files = []
@@ -436,32 +680,26 @@ def play_multi_files():
                 continue
                 
             if not allowed_file(file.filename):
-                return jsonify({
-                    'success': False,
-                    'error': f'Invalid file type: {file.filename}'
-                }), 400
+                return error_response(f'Invalid file type: {file.filename}', 400)
             
-            device_id = mappings.get(str(i))
-            if not device_id:
+            device_id = mappings[i] if by_position else mappings.get(str(i))
+            if device_id is None:
                 continue
             
             # Save file temporarily
             filename = secure_filename(file.filename)
-            with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(filename)[1]) as tmp_file:
-                file.save(tmp_file.name)
-                temp_files.append(tmp_file.name)
-                
-                playback_tasks.append({
-                    'file_path': tmp_file.name,
-                    'device_id': int(device_id),
-                    'filename': filename
-                })
+            temp_file_path = upload_files.acquire(os.path.splitext(filename)[1])
+            file.save(temp_file_path)
+            temp_files.append(temp_file_path)
+            
+            playback_tasks.append({
+                'file_path': temp_file_path,
+                'device_id': int(device_id),
+                'filename': filename
+            })
         
         if not playback_tasks:
-            return jsonify({
-                'success': False,
-                'error': 'No valid file-device mappings'
-            }), 400
+            return json_response(NO_VALID_MAPPINGS, 400)
         
         # Start playback on each device
         results = {}
@@ -469,13 +707,19 @@ def play_multi_files():
         
         # Create status callback for this playback session
         def status_callback(device_id, status):
-            if playback_id in active_playbacks:
-                active_playbacks[playback_id]['device_status'][str(device_id)] = status
+            info = active_playbacks.get(playback_id)
+            if info is not None:
+                info['device_status'][str(device_id)] = status
+                status_changes.notify()
         
-        for task in playback_tasks:
+        # Decode every file at once, then start playback in order
+        load_futures = [LOAD_POOL.submit(audio_manager.load_audio_file, task['file_path'])
+                        for task in playback_tasks]
+        
+        for task, load_future in zip(playback_tasks, load_futures):
             try:
                 # Load audio file
-                audio_data, sample_rate = audio_manager.load_audio_file(task['file_path'])
+                audio_data, sample_rate = load_future.result()
                 
                 # Play on specific device with status callback
                 success = audio_manager.play_on_device(
@@ -506,7 +750,7 @@ def play_multi_files():
         
         successful_devices = sum(1 for r in results.values() if r['success'])
         
-        return jsonify({
+        return json_response({
             'success': True,
             'playback_id': playback_id,
             'devices_playing': successful_devices,
@@ -516,49 +760,105 @@ def play_multi_files():
         })
     
     except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        return error_response(str(e))
+
+
+def playback_status_snapshot():
+    """Per-device status merged with multi-file sessions, plus is_playing."""
+    status = audio_manager.get_device_status()
+    
+    # One pass over a single snapshot of the sessions
+    multi_file_playing = False
+    multi_file_status = {}
+    for playback_info in active_playbacks.values():
+        if playback_info.get('type') == 'multi_file':
+            device_status = playback_info.get('device_status', {})
+            if not multi_file_playing:
+                multi_file_playing = 'Playing' in device_status.values()
+            multi_file_status.update(device_status)
+    
+    # Update the main status with multi-file device statuses
+    if multi_file_playing:
+        for device_id, device_status_value in multi_file_status.items():
+            # session statuses use string ids, the manager uses ints
+            device_index = int(device_id)
+            if device_index in status:
+                status[device_index] = device_status_value
+    
+    return status, audio_manager.is_playing or multi_file_playing
 
 
 @app.route('/api/playback-status', methods=['GET'])
 def get_playback_status():
     """Get current playback status for all devices."""
     try:
-        status = audio_manager.get_device_status()
-        
-        # Check if we have active multi-file playbacks
-        multi_file_playing = False
-        for playback_info in active_playbacks.values():
-            if playback_info.get('type') == 'multi_file':
-                # Check if any devices are still playing
-                device_status = playback_info.get('device_status', {})
-                if any(status == 'Playing' for status in device_status.values()):
-                    multi_file_playing = True
-                    break
-        
-        # Update status for multi-file playbacks
-        if multi_file_playing:
-            for playback_info in active_playbacks.values():
-                if playback_info.get('type') == 'multi_file':
-                    device_status = playback_info.get('device_status', {})
-                    # Update the main status with multi-file device statuses
-                    for device_id, device_status_value in device_status.items():
-                        if device_id in status:
-                            status[device_id] = device_status_value
-        
-        return jsonify({
+        status, is_playing = playback_status_snapshot()
+        body = dumps({
             'success': True,
             'devices': status,
-            'is_playing': audio_manager.is_playing or multi_file_playing
+            'is_playing': is_playing
         })
+        if isinstance(body, str):
+            body = body.encode()
+        
+        # Pollers that send If-None-Match get an empty 304 while nothing changes
+        response = json_response(body)
+        response.set_etag(hashlib.md5(body).hexdigest())
+        response.headers['Cache-Control'] = 'no-cache'
+        return response.make_conditional(request)
     
     except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        return error_response(str(e))
+
+
+STATUS_EVENT_HEARTBEAT = 15.0  # comment line so proxies keep the stream open
+STATUS_EVENT_MAX_TIMEOUT = 120.0  # each open stream holds a server thread
+
+
+@app.route('/api/playback-events', methods=['GET'])
+def playback_events():
+    """Server-sent events: one status message per change instead of polling.
+
+    Each event carries the same body as /api/playback-status. The first is
+    sent immediately; later ones only when a device status or is_playing
+    changes. The stream ends after ?timeout= seconds (default 60).
+    """
+    try:
+        timeout = min(float(request.args.get('timeout', 60)), STATUS_EVENT_MAX_TIMEOUT)
+    except ValueError:
+        return error_response('Invalid timeout', 400)
+    
+    def generate():
+        deadline = time.monotonic() + timeout
+        last_body = None
+        last_sent = time.monotonic()
+        seen = None  # no version seen yet, so the first snapshot goes out at once
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            # Sleep until a status change is signalled; time out for the heartbeat
+            version = status_changes.wait(seen, min(STATUS_EVENT_HEARTBEAT, remaining))
+            if version != seen:
+                seen = version
+                status, is_playing = playback_status_snapshot()
+                body = dumps({'success': True, 'devices': status, 'is_playing': is_playing})
+                if isinstance(body, str):
+                    body = body.encode()
+                if body != last_body:
+                    last_body = body
+                    last_sent = time.monotonic()
+                    yield b'data: ' + body + b'\n\n'
+                    continue
+            now = time.monotonic()
+            if now - last_sent >= STATUS_EVENT_HEARTBEAT and now < deadline:
+                last_sent = now
+                yield b': keep-alive\n\n'
+    
+    response = app.response_class(generate(), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
 
 
 @app.route('/api/upload', methods=['POST'])
@@ -566,24 +866,15 @@ def upload_file():
     """Handle file upload for testing."""
     try:
         if 'file' not in request.files:
-            return jsonify({
-                'success': False,
-                'error': 'No file provided'
-            }), 400
+            return json_response(NO_FILE_PROVIDED, 400)
         
         file = request.files['file']
         
         if not file or file.filename == '':
-            return jsonify({
-                'success': False,
-                'error': 'No file selected'
-            }), 400
+            return json_response(NO_FILE_SELECTED, 400)
         
         if not allowed_file(file.filename):
-            return jsonify({
-                'success': False,
-                'error': 'Invalid file type'
-            }), 400
+            return json_response(INVALID_FILE_TYPE, 400)
         
         # Save file
         filename = secure_filename(file.filename)
@@ -591,7 +882,7 @@ def upload_file():
         os.makedirs('uploads', exist_ok=True)
         file.save(upload_path)
         
-        return jsonify({
+        return json_response({
             'success': True,
             'filename': filename,
             'path': upload_path,
@@ -599,65 +890,46 @@ def upload_file():
         })
     
     except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        return error_response(str(e))
 
 
 @app.errorhandler(413)
 def too_large(e):
     """Handle file too large error."""
-    return jsonify({
-        'success': False,
-        'error': 'File too large. Maximum size is 100MB.'
-    }), 413
+    return json_response(FILE_TOO_LARGE, 413)
 
 
 @app.errorhandler(404)
 def not_found(e):
     """Handle 404 errors."""
-    return jsonify({
-        'success': False,
-        'error': 'Endpoint not found'
-    }), 404
+    return json_response(ENDPOINT_NOT_FOUND, 404)
 
 
 @app.errorhandler(500)
 def internal_error(e):
     """Handle 500 errors."""
-    return jsonify({
-        'success': False,
-        'error': 'Internal server error'
-    }), 500
+    return json_response(INTERNAL_ERROR, 500)
 
 
 def cleanup_temp_files():
-    """Cleanup temporary files periodically."""
+    """Remove temp files as each playback session reaches PLAYBACK_TTL."""
     while True:
-        time.sleep(300)  # Clean up every 5 minutes
         try:
-            # Clean up old playback files
-            current_time = time.time()
-            to_remove = []
-            
-            for playback_id, info in active_playbacks.items():
-                if current_time - info['start_time'] > 600:  # 10 minutes old
-                    to_remove.append(playback_id)
-            
-            for playback_id in to_remove:
-                info = active_playbacks[playback_id]
-                try:
-                    if os.path.exists(info['file_path']):
-                        os.unlink(info['file_path'])
-                except:
-                    pass
-                del active_playbacks[playback_id]
+            for info in active_playbacks.wait_expired():
+                remove_playback_files(info)
         
         except Exception as e:
             print(f"Error in cleanup: {e}")
 
 
+def run_server(host='0.0.0.0', port=5000):
+    """Serve the app with waitress (bounded thread pool, keep-alive) when installed."""
+    if serve is not None:
+        serve(app, host=host, port=port, threads=16, connection_limit=256, channel_timeout=30)
+    else:
+        app.run(host=host, port=port, threaded=True)
+
+
 if __name__ == '__main__':
     # Start cleanup thread
     cleanup_thread = threading.Thread(target=cleanup_temp_files, daemon=True)
@@ -672,4 +944,4 @@ if __name__ == '__main__':
     print("Open your browser and go to: http://localhost:5000")
     print("Press Ctrl+C to stop the server")
     
-    app.run(host='0.0.0.0', port=5000, debug=True, threaded=True)
+    run_server()
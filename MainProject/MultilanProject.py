@@ -1,19 +1,26 @@
 # stt_translator_ui.py
-import sys, os, tempfile, threading, requests, time, queue
+import sys, os, io, threading, time, queue, hashlib, socket, asyncio, atexit
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import httpx
 from gtts import gTTS
 import pygame
-import pyaudio
-import wave
+import sounddevice as sd
 import numpy as np
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QPushButton, QTextEdit, QLabel, QCheckBox, QFrame, QGroupBox,
     QProgressBar, QSplitter, QSizePolicy
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QObject, QPropertyAnimation, QEasingCurve, QRect, QPoint
-from PyQt5.QtGui import QPainter, QColor, QFont, QFontMetrics, QPixmap, QIcon
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QVariantAnimation, QEasingCurve, QRect, QPoint, QTimer
+from PyQt5.QtGui import QPainter, QColor, QFont, QFontMetrics, QPixmap, QIcon, QPen
 import speech_recognition as sr
 
+try:
+    import webrtcvad
+except ImportError:
+    webrtcvad = None  # fall back to the energy threshold
+
 # ----------------- signals
 class Signals(QObject):
     transcription_ready = pyqtSignal(str)
@@ -44,12 +51,24 @@ class ToggleSwitch(QWidget):
         self.text_color_on = QColor(255, 255, 255)
         self.icon_color_off = QColor(100, 100, 100)
         self.icon_color_on = QColor(255, 255, 255)
+        self.border_color_off = QColor(200, 200, 200)
+        self.border_color_on = QColor(76, 175, 80)
+        self.shadow_color = QColor(0, 0, 0, 40)
+        
+        # Fonts (built once, not on every repaint)
+        self._font_icon = QFont()
+        self._font_icon.setPointSize(16)  # Proportional to toggle button height
+        self._font_text = QFont()
+        self._font_text.setPointSize(10)  # Proportional to toggle button height
+        self._font_text.setBold(True)
         
         # Animation properties
         self.thumb_position = 3  # Start position (off state)
         self.target_position = 3
         self.background_opacity = 0.3
         self.target_opacity = 0.3
+        self._position_curve = QEasingCurve(QEasingCurve.OutBack)
+        self._opacity_curve = QEasingCurve(QEasingCurve.OutCubic)
         
         # Toggle button dimensions (fixed on left side)
         self.toggle_width = 55
@@ -60,6 +79,10 @@ class ToggleSwitch(QWidget):
         # Text area positioning (right side with proper spacing)
         self.text_area_x = 65
         
+        # Pre-rendered layers, built on first paint
+        self._thumb_sprite = None
+        self._label_layer = None
+        
         # Language icons mapping
         self.language_icons = {
             "Japanese": "🇯🇵",
@@ -82,66 +105,91 @@ class ToggleSwitch(QWidget):
     def start_animation(self):
         if self.animation:
             self.animation.stop()
-            
-        # Create animation for thumb position
-        self.animation = QPropertyAnimation(self, b"thumb_position")
+        
+        # One animation drives both the thumb and the background fade, so
+        # each tick repaints once. Each field gets its own easing curve.
+        self._start_position = self.thumb_position
+        self._start_opacity = self.background_opacity
+        self.animation = QVariantAnimation(self)
         self.animation.setDuration(300)
-        self.animation.setEasingCurve(QEasingCurve.OutBack)
-        self.animation.setStartValue(self.thumb_position)
-        self.animation.setEndValue(self.target_position)
-        self.animation.valueChanged.connect(self.update)
+        self.animation.setStartValue(0.0)
+        self.animation.setEndValue(1.0)
+        self.animation.valueChanged.connect(self.on_animation_step)
         self.animation.finished.connect(self.on_animation_finished)
-        
-        # Background opacity animation
-        self.bg_animation = QPropertyAnimation(self, b"background_opacity")
-        self.bg_animation.setDuration(300)
-        self.bg_animation.setEasingCurve(QEasingCurve.OutCubic)
-        self.bg_animation.setStartValue(self.background_opacity)
-        self.bg_animation.setEndValue(self.target_opacity)
-        self.bg_animation.valueChanged.connect(self.update)
-        
         self.animation.start()
-        self.bg_animation.start()
+        
+    def on_animation_step(self, progress):
+        move = self._position_curve.valueForProgress(progress)
+        fade = self._opacity_curve.valueForProgress(progress)
+        self.thumb_position = self._start_position + move * (self.target_position - self._start_position)
+        self.background_opacity = self._start_opacity + fade * (self.target_opacity - self._start_opacity)
+        self.update()
         
     def on_animation_finished(self):
         # Ensure final position is set correctly
         self.thumb_position = self.target_position
         self.background_opacity = self.target_opacity
+        self.update()
         
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
         # Draw toggle button background (fixed on left side)
-        toggle_bg_color = self.bg_color_on if self.checked else self.bg_color_off
+        # Copy before fading so the stored colors keep full alpha
+        toggle_bg_color = QColor(self.bg_color_on if self.checked else self.bg_color_off)
         toggle_bg_color.setAlphaF(self.background_opacity)
+        # Fill and border go down in one pass over the rounded rect
+        toggle_border_color = self.border_color_on if self.checked else self.border_color_off
         painter.setBrush(toggle_bg_color)
-        painter.setPen(Qt.NoPen)
+        painter.setPen(QPen(toggle_border_color, 1))
         painter.drawRoundedRect(self.toggle_x, self.toggle_y, self.toggle_width, self.toggle_height, 14, 14)
         
-        # Draw toggle button border
-        toggle_border_color = QColor(200, 200, 200) if not self.checked else QColor(76, 175, 80)
-        painter.setPen(toggle_border_color)
-        painter.setBrush(Qt.NoBrush)
-        painter.drawRoundedRect(self.toggle_x, self.toggle_y, self.toggle_width, self.toggle_height, 14, 14)
-        
-        # Draw thumb with shadow effect (inside smaller toggle button)
-        thumb_size = 18
-        thumb_rect = QRect(int(self.thumb_position), self.toggle_y + 3, thumb_size, thumb_size)
+        # Thumb and label never change shape, so they are blitted from
+        # pixmaps rendered once instead of being re-rasterized every frame
+        painter.drawPixmap(int(self.thumb_position), self.toggle_y + 3, self.thumb_sprite())
+        if self.text:
+            painter.drawPixmap(0, 0, self.label_layer())
+            
+    def _stale(self, pixmap):
+        # also rebuild after moving to a screen with another pixel ratio
+        return pixmap is None or pixmap.devicePixelRatio() != self.devicePixelRatioF()
         
-        # Shadow
-        shadow_rect = QRect(thumb_rect.x() + 1, thumb_rect.y() + 1, thumb_size, thumb_size)
-        painter.setBrush(QColor(0, 0, 0, 40))
-        painter.setPen(Qt.NoPen)
-        painter.drawEllipse(shadow_rect)
+    def _blank_pixmap(self, width, height):
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(width * ratio), int(height * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        return pixmap
         
-        # Thumb
-        painter.setBrush(self.thumb_color)
-        painter.setPen(Qt.NoPen)
-        painter.drawEllipse(thumb_rect)
+    def thumb_sprite(self):
+        """Thumb with its drop shadow, drawn at the origin."""
+        if self._stale(self._thumb_sprite):
+            # Draw thumb with shadow effect (inside smaller toggle button)
+            thumb_size = 18
+            sprite = self._blank_pixmap(thumb_size + 1, thumb_size + 1)
+            painter = QPainter(sprite)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(Qt.NoPen)
+            
+            # Shadow
+            painter.setBrush(self.shadow_color)
+            painter.drawEllipse(QRect(1, 1, thumb_size, thumb_size))
+            
+            # Thumb
+            painter.setBrush(self.thumb_color)
+            painter.drawEllipse(QRect(0, 0, thumb_size, thumb_size))
+            painter.end()
+            self._thumb_sprite = sprite
+        return self._thumb_sprite
         
-        # Draw icon and text (fixed on right side with proper spacing)
-        if self.text:
+    def label_layer(self):
+        """Icon and text, laid out in widget coordinates."""
+        if self._stale(self._label_layer):
+            layer = self._blank_pixmap(self.width(), self.height())
+            painter = QPainter(layer)
+            painter.setRenderHint(QPainter.Antialiasing)
+            
             # Get icon for this language
             icon_text = self.language_icons.get(self.text, "")
             
@@ -155,19 +203,21 @@ class ToggleSwitch(QWidget):
             # Draw icon (proportional to toggle button size)
             if icon_text:
                 painter.setPen(self.icon_color_off)
-                font = QFont()
-                font.setPointSize(16)  # Proportional to toggle button height
-                painter.setFont(font)
+                painter.setFont(self._font_icon)
                 painter.drawText(icon_x, toggle_center_y + 6, icon_text)
             
             # Draw text (proportional to toggle button size)
             painter.setPen(self.text_color_off)
-            font = QFont()
-            font.setPointSize(10)  # Proportional to toggle button height
-            font.setBold(True)
-            painter.setFont(font)
+            painter.setFont(self._font_text)
             painter.drawText(text_x, toggle_center_y + 6, self.text)
-            
+            painter.end()
+            self._label_layer = layer
+        return self._label_layer
+        
+    def resizeEvent(self, event):
+        self._label_layer = None
+        super().resizeEvent(event)
+        
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
             self.setChecked(not self.checked)
@@ -193,104 +243,194 @@ TARGET_LANGS = {
     "Vietnamese": "vi",
     "English": "en"
 }
+CODE_TO_NAME = {code: name for name, code in TARGET_LANGS.items()}
 
 # VAD Settings
-VAD_SILENCE_TIMEOUT = 1.5  # Stop recording after 3 seconds of silence
-VAD_ENERGY_THRESHOLD = 500  # Energy threshold for voice detection
-VAD_FRAME_DURATION = 0.1   # Frame duration in seconds
-VAD_CHUNK_SIZE = 1024      # Audio chunk size
+VAD_SILENCE_TIMEOUT = 1.5  # Stop recording after this many seconds of silence
+VAD_ENERGY_THRESHOLD = 500  # Energy threshold, used when webrtcvad is missing
+VAD_MODE = 2               # webrtcvad aggressiveness, 0 (lenient) to 3 (strict)
+VAD_SAMPLE_RATE = 16000
+VAD_FRAME_DURATION = 0.02  # webrtcvad accepts 10, 20 or 30 ms frames
+VAD_CHUNK_SIZE = int(VAD_SAMPLE_RATE * VAD_FRAME_DURATION)  # 320 samples
+
+# How long the UI waits to gather translation results into one repaint
+TRANSLATION_FLUSH_MS = 30
 
 # Translation endpoints
 GOOGLE_TRANSLATE_URL = "https://translate.googleapis.com/translate_a/single"
 MYMEMORY_URL = "https://api.mymemory.translated.net/get"
 
+# Translation requests run as coroutines on one background event loop and
+# share a keep-alive client, so the per-language fan-out is concurrent
+# without a thread per request and reuses warm TLS connections
+LOOP = asyncio.new_event_loop()
+threading.Thread(target=LOOP.run_forever, name="net-loop", daemon=True).start()
+_client = None
+
+# Memoized translations per (text, target_code); failures are never stored
+TRANSLATION_CACHE_SIZE = 256
+_translations = OrderedDict()
+
+def get_client():
+    """Shared keep-alive client; only call from coroutines on LOOP."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=10,
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+        )
+    return _client
+
+def run_async(coro):
+    """Schedule a coroutine on LOOP from any thread."""
+    return asyncio.run_coroutine_threadsafe(coro, LOOP)
+
+async def _close_client():
+    if _client is not None:
+        await _client.aclose()
+
+def close_network():
+    try:
+        run_async(_close_client()).result(timeout=2)
+    except Exception:
+        pass
+    LOOP.call_soon_threadsafe(LOOP.stop)
+
+atexit.register(close_network)
+
+# Generated speech is kept per (text, language) so re-recording a phrase
+# or pressing Play Again doesn't call gTTS again
+TTS_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "leaudio", "tts")
+TTS_CACHE_MAX_BYTES = 50 * 1024 * 1024
+
+# Decoded pygame Sounds, keyed by their cache path
+SOUND_CACHE_SIZE = 16
+_sounds = OrderedDict()
+_sounds_lock = threading.Lock()
+
 # ----------------- Workers
-def calculate_energy(audio_data):
-    """Calculate energy of audio frame for VAD"""
-    return np.sum(np.frombuffer(audio_data, dtype=np.int16) ** 2) / len(audio_data)
+def calculate_energy(audio_data, scratch=None):
+    """Calculate energy of audio frame for VAD.
+
+    The samples are cast into a float32 buffer (reused when the caller
+    passes one) and squared-and-summed with a single dot product, so no
+    squared temporary is built per frame. float32 also keeps the sum clear
+    of the int16/int32 overflow that a plain integer dot would hit.
+    """
+    samples = np.frombuffer(audio_data, dtype=np.int16)
+    if scratch is None or scratch.size < samples.size:
+        scratch = np.empty(samples.size, dtype=np.float32)
+    x = scratch[:samples.size]
+    np.copyto(x, samples, casting='unsafe')
+    return float(np.dot(x, x)) / len(audio_data)
+
+class VadState:
+    """Per-recording speech/silence state machine, fed one frame at a time.
+
+    process_frame() returns one of the step codes below so the
+    recording loop only has to react to transitions. __slots__ keeps the
+    per-frame attribute lookups off the instance dict.
+    """
+    __slots__ = ("vad", "scratch", "silence_limit", "silent_frames", "voice_detected")
+
+    WAITING = 0      # no speech yet
+    VOICE_START = 1  # first speech frame
+    SPEECH = 2
+    HANGOVER = 3     # silence after speech, still counting down
+    END = 4          # silence lasted VAD_SILENCE_TIMEOUT
+
+    def __init__(self):
+        self.vad = webrtcvad.Vad(VAD_MODE) if webrtcvad is not None else None
+        self.scratch = np.empty(VAD_CHUNK_SIZE, dtype=np.float32)
+        # Hangover: how many consecutive non-speech frames end the utterance
+        self.silence_limit = int(round(VAD_SILENCE_TIMEOUT / VAD_FRAME_DURATION))
+        self.silent_frames = 0
+        self.voice_detected = False
+
+    def is_speech(self, data):
+        if self.vad is not None:
+            return self.vad.is_speech(data, VAD_SAMPLE_RATE)
+        return calculate_energy(data, self.scratch) > VAD_ENERGY_THRESHOLD
+
+    def process_frame(self, data):
+        if self.is_speech(data):
+            self.silent_frames = 0
+            if self.voice_detected:
+                return self.SPEECH
+            self.voice_detected = True
+            return self.VOICE_START
+        if not self.voice_detected:
+            return self.WAITING
+        self.silent_frames += 1
+        if self.silent_frames >= self.silence_limit:
+            return self.END
+        return self.HANGOVER
+
+    def remaining_silence(self):
+        """Seconds of silence left before END."""
+        return (self.silence_limit - self.silent_frames) * VAD_FRAME_DURATION
 
 def do_record_with_vad():
-    """Record with Voice Activity Detection - stops after 3s of silence"""
+    """Record with Voice Activity Detection - stops after VAD_SILENCE_TIMEOUT of silence"""
     signals.set_status.emit("Recording... (speak now)")
     
     # Audio configuration
     CHUNK = VAD_CHUNK_SIZE
-    FORMAT = pyaudio.paInt16
     CHANNELS = 1
-    RATE = 16000
-    
-    p = pyaudio.PyAudio()
-    
+    RATE = VAD_SAMPLE_RATE
+    SAMPLE_WIDTH = 2  # int16
+
+    # PortAudio delivers blocks on its own thread; the callback only hands
+    # them over so a slow VAD step can never cause an input overflow.
+    block_queue = queue.Queue()
+
+    def on_block(indata, frame_count, time_info, status):
+        block_queue.put_nowait(bytes(indata))
+
     try:
-        stream = p.open(format=FORMAT,
-                       channels=CHANNELS,
-                       rate=RATE,
-                       input=True,
-                       frames_per_buffer=CHUNK)
-        
-        frames = []
-        last_voice_time = time.time()
+        frames = bytearray()  # grows in place, no join at the end
+        vad_state = VadState()
+        last_countdown = None
         recording = True
-        voice_detected = False
         
-        while recording:
-            data = stream.read(CHUNK, exception_on_overflow=False)
-            frames.append(data)
-            
-            # Calculate energy for VAD
-            energy = calculate_energy(data)
+        with sd.RawInputStream(samplerate=RATE, channels=CHANNELS, dtype='int16',
+                               blocksize=CHUNK, callback=on_block):
+            while recording:
+                try:
+                    data = block_queue.get(timeout=2)
+                except queue.Empty:
+                    raise RuntimeError("No audio from microphone") from None
+                frames += data
             
-            # Check if voice is detected
-            if energy > VAD_ENERGY_THRESHOLD:
-                last_voice_time = time.time()
-                if not voice_detected:
-                    voice_detected = True
+                step = vad_state.process_frame(data)
+                if step == VadState.VOICE_START:
                     signals.set_status.emit("Voice detected... (keep speaking)")
-            else:
-                # Check if we've been silent too long
-                silence_duration = time.time() - last_voice_time
-                if voice_detected and silence_duration > 1.5:  # Fixed 3 seconds
+                elif step == VadState.END:
                     recording = False
                     signals.set_status.emit("Silence detected, processing...")
-                elif voice_detected:
-                    # Show countdown
-                    remaining = 1.5 - silence_duration
-                    if remaining > 0:
-                        signals.set_status.emit(f"Silence detected... stopping in {remaining:.1f}s")
-        
-        stream.stop_stream()
-        stream.close()
+                elif step == VadState.HANGOVER:
+                    # Show countdown, but only when the displayed tenth changes
+                    countdown = f"{vad_state.remaining_silence():.1f}"
+                    if countdown != last_countdown:
+                        last_countdown = countdown
+                        signals.set_status.emit(f"Silence detected... stopping in {countdown}s")
+                elif step == VadState.SPEECH:
+                    last_countdown = None
         
         if len(frames) > 0:
-            # Convert frames to audio data
-            audio_data = b''.join(frames)
-            
-            # Create temporary WAV file
-            temp_wav = tempfile.NamedTemporaryFile(delete=False, suffix='.wav')
-            with wave.open(temp_wav.name, 'wb') as wf:
-                wf.setnchannels(CHANNELS)
-                wf.setsampwidth(p.get_sample_size(FORMAT))
-                wf.setframerate(RATE)
-                wf.writeframes(audio_data)
+            # Hand the raw PCM straight to speech_recognition; no WAV round-trip
+            audio = sr.AudioData(bytes(frames), RATE, SAMPLE_WIDTH)
             
             # Transcribe the audio
             signals.set_status.emit("Transcribing...")
             r = sr.Recognizer()
             try:
-                with sr.AudioFile(temp_wav.name) as source:
-                    audio = r.record(source)
                 text = r.recognize_google(audio, language="ko-KR", show_all=False)
                 signals.transcription_ready.emit(text)
                 signals.set_status.emit("Transcription done.")
             except Exception as e:
                 signals.set_status.emit(f"STT error: {e}")
                 signals.transcription_ready.emit("")
-            finally:
-                # Clean up temp file
-                try:
-                    os.unlink(temp_wav.name)
-                except:
-                    pass
         else:
             signals.set_status.emit("No audio recorded")
             signals.transcription_ready.emit("")
@@ -298,47 +438,123 @@ def do_record_with_vad():
     except Exception as e:
         signals.set_status.emit(f"Recording error: {e}")
         signals.transcription_ready.emit("")
-    finally:
-        p.terminate()
 
 
-def do_translate(text, target_code):
+async def _get_json(url, params):
+    resp = await get_client().get(url, params=params)
+    resp.raise_for_status()
+    return resp.json()
+
+async def translate_text(text, target_code):
+    """Translate Korean text, trying Google first and MyMemory second.
+
+    Results are memoized per (text, target_code); a failure raises, so it
+    is never cached and the next attempt goes back to the network.
+    """
+    key = (text, target_code)
+    if key in _translations:
+        _translations.move_to_end(key)
+        return _translations[key]
+
+    # Try Google API (no-key quick endpoint)
+    try:
+        params = {
+            "client": "gtx",
+            "sl": "ko",
+            "tl": target_code,
+            "dt": "t",
+            "q": text
+        }
+        data = await _get_json(GOOGLE_TRANSLATE_URL, params)
+        translated = data[0][0][0] if data and data[0] else ""
+        if not translated:
+            raise ValueError("empty Google translation")
+    except Exception:
+        # Fallback to MyMemory
+        params = {"q": text, "langpair": f"ko|{target_code}"}
+        data = await _get_json(MYMEMORY_URL, params)
+        translated = data.get("responseData", {}).get("translatedText", "")
+        if data.get("responseStatus") != 200 or not translated:
+            raise ValueError(f"MyMemory error: {data.get('responseDetails') or 'empty translation'}")
+
+    # only LOOP touches the cache, so no lock is needed
+    _translations[key] = translated
+    if len(_translations) > TRANSLATION_CACHE_SIZE:
+        _translations.popitem(last=False)
+    return translated
+
+async def do_translate(text, target_code):
     try:
-        translated = ""
-        # Try Google API (no-key quick endpoint)
         try:
-            params = {
-                "client": "gtx",
-                "sl": "ko",
-                "tl": target_code,
-                "dt": "t",
-                "q": text
-            }
-            resp = requests.get(GOOGLE_TRANSLATE_URL, params=params, timeout=10)
-            resp.raise_for_status()
-            data = resp.json()
-            if data and len(data) > 0 and len(data[0]) > 0:
-                translated = data[0][0][0]
+            translated = await translate_text(text, target_code)
         except Exception:
-            # Fallback to MyMemory
-            try:
-                params = {"q": text, "langpair": f"ko|{target_code}"}
-                resp = requests.get(MYMEMORY_URL, params=params, timeout=10)
-                resp.raise_for_status()
-                data = resp.json()
-                translated = data.get("responseData", {}).get("translatedText", "")
-            except Exception:
-                translated = "Translation failed"
+            translated = "Translation failed"
 
         signals.translation_ready.emit(translated, target_code)
     except Exception as e:
         signals.translation_ready.emit(f"Error: {e}", target_code)
 
-def do_tts(text, target_code, audio_file):
+async def translate_all(text, target_codes):
+    """Translate text into every target language concurrently."""
+    await asyncio.gather(*(do_translate(text, code) for code in target_codes))
+
+async def prewarm_session():
+    """Open the translation connection ahead of the first click."""
+    try:
+        await get_client().head(GOOGLE_TRANSLATE_URL, timeout=5)
+    except Exception:
+        pass
+
+def tts_cache_path(text, target_code):
+    """Where the MP3 for (text, target_code) lives in the TTS cache."""
+    digest = hashlib.sha1(text.encode("utf-8")).hexdigest()
+    return os.path.join(TTS_CACHE_DIR, f"{digest}_{target_code}.mp3")
+
+def prune_tts_cache():
+    """Delete the least recently used MP3s once the cache passes its size cap."""
+    try:
+        entries = []
+        for entry in os.scandir(TTS_CACHE_DIR):
+            if entry.name.endswith(".mp3"):
+                st = entry.stat()
+                entries.append((st.st_atime, st.st_size, entry.path))
+    except OSError:
+        return
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= TTS_CACHE_MAX_BYTES:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+def do_tts(text, target_code):
     try:
         if text and text != "Translation failed" and not text.startswith("Error:"):
-            tts = gTTS(text=text, lang=target_code)
-            tts.save(audio_file)
+            audio_file = tts_cache_path(text, target_code)
+            if not os.path.exists(audio_file):
+                os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+                tts = gTTS(text=text, lang=target_code, lang_check=False)
+                # write beside the final name first so a half-written file
+                # is never mistaken for a cache hit
+                partial = f"{audio_file}.{threading.get_ident()}.part"
+                mp3 = io.BytesIO()
+                tts.write_to_fp(mp3)
+                try:
+                    with open(partial, "wb") as f:
+                        f.write(mp3.getbuffer())
+                    os.replace(partial, audio_file)
+                except Exception:
+                    if os.path.exists(partial):
+                        os.remove(partial)
+                    raise
+                prune_tts_cache()
+                # decode here, on the TTS worker, from the bytes already in
+                # memory, so playback doesn't read the file back or decode
+                # the MP3 once its tts_ready is handled
+                load_sound(audio_file, mp3)
             signals.tts_ready.emit(audio_file, target_code)
         else:
             signals.tts_ready.emit("", target_code)
@@ -346,43 +562,51 @@ def do_tts(text, target_code, audio_file):
         print(f"TTS error for {target_code}: {e}")
         signals.tts_ready.emit("", target_code)
 
-def play_all_audio(audio_files):
+def prewarm():
+    """Pay first-use costs (PortAudio, DNS, TLS) before the first click."""
+    try:
+        sd.query_devices(kind="input")
+    except Exception:
+        pass
     try:
+        socket.getaddrinfo("translate.google.com", 443)  # gTTS host
+        run_async(prewarm_session()).result(timeout=10)
+    except Exception:
+        pass
+
+def ensure_mixer():
+    """Open the pygame mixer on first use; later calls are free."""
+    if pygame.mixer.get_init() is None:
         pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
-        sounds = []
-        for audio_file in audio_files:
-            if os.path.exists(audio_file):
-                sound = pygame.mixer.Sound(audio_file)
-                sounds.append((sound, audio_file))
-                sound.play()
-
-        if sounds:
-            pygame.time.wait(100)
-            # wait while any are playing
-            while any(sound.get_num_channels() > 0 for (sound, _) in sounds):
-                pygame.time.wait(100)
-
-        # cleanup
-        for (_, audio_file) in sounds:
-            try:
-                os.remove(audio_file)
-            except:
-                pass
-    except Exception as e:
-        print(f"Audio playback error (simul): {e}")
-        for audio_file in audio_files:
-            try:
-                os.remove(audio_file)
-            except:
-                pass
+
+def load_sound(audio_file, data=None):
+    """Return a decoded Sound for audio_file, from memory when possible.
+
+    data, if given, is a file-like object holding the MP3 bytes. The last
+    SOUND_CACHE_SIZE decoded sounds are kept so replays skip the decode.
+    """
+    with _sounds_lock:
+        sound = _sounds.get(audio_file)
+        if sound is not None:
+            _sounds.move_to_end(audio_file)
+            return sound
+    ensure_mixer()
+    if data is not None:
+        data.seek(0)
+        sound = pygame.mixer.Sound(file=data)
+    else:
+        sound = pygame.mixer.Sound(audio_file)
+    with _sounds_lock:
+        _sounds[audio_file] = sound
+        if len(_sounds) > SOUND_CACHE_SIZE:
+            _sounds.popitem(last=False)
+    return sound
 
 def play_single_audio_file(audio_file):
     """Play one file (non-blocking)"""
     try:
-        pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
-        if os.path.exists(audio_file):
-            sound = pygame.mixer.Sound(audio_file)
-            sound.play()
+        if audio_file in _sounds or os.path.exists(audio_file):
+            load_sound(audio_file).play()
     except Exception as e:
         print(f"Audio single playback error: {e}")
 
@@ -396,12 +620,16 @@ class MainWindow(QWidget):
 
         # state trackers
         self.pending_translations = 0
-        self.audio_files = []            # list used for simultaneous play
+        self.tts_auto_play = set()       # codes whose tts_ready should auto-play
         self.audio_files_map = {}        # code -> path (for Play buttons)
         self.translations = {}           # code -> text
         self.trans_boxes = {}            # language name -> QTextEdit
         self.play_buttons = {}           # language name -> QPushButton
 
+        # background work (TTS, playback) shares a few
+        # long-lived workers instead of a new thread per job
+        self.pool = ThreadPoolExecutor(max_workers=len(TARGET_LANGS), thread_name_prefix="worker")
+
         # Main layout
         main_layout = QVBoxLayout()
         main_layout.setSpacing(20)
@@ -436,6 +664,13 @@ class MainWindow(QWidget):
 
         self.setLayout(main_layout)
 
+        # translation results are applied in batches, see on_translation_ready
+        self._translation_batch = []
+        self._translation_flush = QTimer(self)
+        self._translation_flush.setSingleShot(True)
+        self._translation_flush.setInterval(TRANSLATION_FLUSH_MS)
+        self._translation_flush.timeout.connect(self.flush_translations)
+
         # connect signals
         signals.transcription_ready.connect(self.on_transcription_ready)
         signals.set_status.connect(self.on_status)
@@ -443,6 +678,11 @@ class MainWindow(QWidget):
         signals.tts_ready.connect(self.on_tts_ready)
         signals.all_translations_done.connect(self.on_all_translations_done)
 
+    def closeEvent(self, event):
+        # drop queued jobs; running ones end on their own (HTTP calls time out)
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        super().closeEvent(event)
+
     def load_stylesheet(self):
         try:
             script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -626,7 +866,10 @@ class MainWindow(QWidget):
             box.clear()
         self.audio_files_map.clear()
         self.translations.clear()
+        self._translation_flush.stop()
+        self._translation_batch = []
         self.pending_translations = 0
+        self.tts_auto_play.clear()
         
         # Set recording state with red background
         self.record_button.setEnabled(False)
@@ -670,37 +913,45 @@ class MainWindow(QWidget):
             self.record_button.setEnabled(True)
             return
 
-        # start translation threads
-        for name, code in selected:
-            threading.Thread(target=do_translate, args=(text, code), daemon=True).start()
+        # fan the translations out concurrently on the network loop
+        run_async(translate_all(text, [code for name, code in selected]))
 
         self.record_button.setEnabled(True)
 
     def on_translation_ready(self, translated_text, target_code):
-        # map code -> name, update UI
-        for name, code in TARGET_LANGS.items():
-            if code == target_code:
-                self.trans_boxes[name].setPlainText(translated_text)
-                self.translations[code] = translated_text
-                break
-
-        self.pending_translations -= 1
-        if self.pending_translations == 0:
+        # results from the workers tend to land within a few ms of each
+        # other; collect them and apply the whole batch in one layout pass
+        self._translation_batch.append((translated_text, target_code))
+        if not self._translation_flush.isActive():
+            self._translation_flush.start()
+
+    def flush_translations(self):
+        batch, self._translation_batch = self._translation_batch, []
+        self.setUpdatesEnabled(False)
+        try:
+            for translated_text, target_code in batch:
+                # map code -> name, update UI
+                name = CODE_TO_NAME.get(target_code)
+                if name:
+                    self.trans_boxes[name].setPlainText(translated_text)
+                    self.translations[target_code] = translated_text
+        finally:
+            self.setUpdatesEnabled(True)
+
+        self.pending_translations -= len(batch)
+        if batch and self.pending_translations == 0:
             # start TTS generation
             self.start_tts_generation()
 
     def start_tts_generation(self):
         self.pending_translations = len(self.translations)
-        self.audio_files = []
         # create TTS threads for each translation
         for code, text in self.translations.items():
             if text and text != "Translation failed" and not text.startswith("Error:"):
-                tmp = tempfile.NamedTemporaryFile(delete=False, suffix=f"_{code}.mp3")
-                tmp.close()
-                self.audio_files.append(tmp.name)
                 # store placeholder in map until tts_ready
                 self.audio_files_map[code] = ""
-                threading.Thread(target=do_tts, args=(text, code, tmp.name), daemon=True).start()
+                self.tts_auto_play.add(code)
+                self.pool.submit(do_tts, text, code)
             else:
                 self.pending_translations -= 1
 
@@ -708,28 +959,34 @@ class MainWindow(QWidget):
             signals.all_translations_done.emit()
 
     def on_tts_ready(self, audio_file, target_code):
+        # only jobs from start_tts_generation auto-play and count down;
+        # a Play Again regeneration plays its own file
+        auto_play = target_code in self.tts_auto_play
+        self.tts_auto_play.discard(target_code)
         # store file path for this language code
         if audio_file:
             self.audio_files_map[target_code] = audio_file
+            # play each language as soon as its audio exists instead of
+            # holding all of them back for the slowest gTTS call; the
+            # mixer overlaps them the same way simultaneous playback did
+            if auto_play:
+                self.pool.submit(play_single_audio_file, audio_file)
             # enable corresponding play button
-            for name, code in TARGET_LANGS.items():
-                if code == target_code:
-                    btn = self.play_buttons.get(name)
-                    if btn:
-                        btn.setEnabled(True)
-                    break
+            btn = self.play_buttons.get(CODE_TO_NAME.get(target_code))
+            if btn:
+                btn.setEnabled(True)
         else:
             # tts failed for this language
             self.audio_files_map[target_code] = ""
+        if not auto_play:
+            return
         self.pending_translations -= 1
         if self.pending_translations == 0:
             signals.all_translations_done.emit()
 
     def on_all_translations_done(self):
-        # if we have audio files for simultaneous playback, start it (optional)
-        files_for_simul = [f for f in self.audio_files if os.path.exists(f)]
-        if files_for_simul:
-            threading.Thread(target=play_all_audio, args=(files_for_simul,), daemon=True).start()
+        # playback already started per language in on_tts_ready
+        self.on_status("All translations ready.")
 
     # Play Again handler (single language)
     def on_play_again(self, language_name):
@@ -738,31 +995,26 @@ class MainWindow(QWidget):
             return
         audio_file = self.audio_files_map.get(code)
         if audio_file and os.path.exists(audio_file):
-            threading.Thread(target=play_single_audio_file, args=(audio_file,), daemon=True).start()
+            self.pool.submit(play_single_audio_file, audio_file)
         else:
             # If TTS is not available (maybe user toggled late), attempt to generate TTS right now
             text = self.translations.get(code, "")
             if text:
-                tmp = tempfile.NamedTemporaryFile(delete=False, suffix=f"_{code}.mp3")
-                tmp.close()
                 # generate now (blocking TTS in background)
-                threading.Thread(target=self._generate_and_play_now, args=(text, code, tmp.name), daemon=True).start()
+                self.pool.submit(self._generate_and_play_now, text, code)
 
 
-    def _generate_and_play_now(self, text, code, tmpfile):
-        do_tts(text, code, tmpfile)
-        if os.path.exists(tmpfile):
-            play_single_audio_file(tmpfile)
-            try:
-                import time
-                time.sleep(1)
-                os.remove(tmpfile)
-            except:
-                pass
+    def _generate_and_play_now(self, text, code):
+        do_tts(text, code)
+        audio_file = tts_cache_path(text, code)
+        if os.path.exists(audio_file):
+            play_single_audio_file(audio_file)
 
 # ----------------- Run
 def main():
     app = QApplication(sys.argv)
+    ensure_mixer()
+    threading.Thread(target=prewarm, daemon=True).start()
     w = MainWindow()
     w.show()
     sys.exit(app.exec_())
@@ -5,38 +5,95 @@ Test script to identify exactly why the system is auto-stopping.
 """
 
 import requests
-import tempfile
-import os
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import io
+import functools
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import soundfile as sf
 import time
 import json
 
-def create_short_test_audio_file():
-    """Create a very short test audio file."""
-    sample_rate = 44100
-    duration = 3.0  # 3 seconds
-    
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
-    tone = np.sin(2 * np.pi * 440 * t).astype(np.float32)  # A4 note
-    stereo_tone = np.column_stack([tone, tone])
-    
-    with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-        sf.write(tmp_file.name, stereo_tone, sample_rate)
-        return tmp_file.name
+def make_stereo_tone(frequency, duration=3.0, sample_rate=44100):
+    """Sine tone as 16-bit PCM, both channels sharing one mono buffer."""
+    phase = np.arange(int(sample_rate * duration), dtype=np.float32)
+    phase *= np.float32(2 * np.pi * frequency / sample_rate)
+    pcm = (np.sin(phase, out=phase) * 32767).astype(np.int16)
+    # a broadcast view, not a copy; soundfile interleaves it on write
+    return np.broadcast_to(pcm[:, None], (pcm.size, 2))
+
+@functools.lru_cache(maxsize=8)
+def make_wav_bytes(frequency, duration=3.0, sample_rate=44100):
+    """WAV file contents for a test tone, built once per distinct tone."""
+    buf = io.BytesIO()
+    sf.write(buf, make_stereo_tone(frequency, duration, sample_rate), sample_rate,
+             format='WAV', subtype='PCM_16')
+    return buf.getvalue()
+
+def watch_playback_status(session, base_url, seconds):
+    """Yield (elapsed, status_data) for each status change the server pushes.
+
+    Uses the /api/playback-events stream, so transitions arrive as they
+    happen instead of on a 1 s polling grid. The server closes the stream
+    after `seconds`.
+    """
+    start_time = time.monotonic()
+    with session.get(f"{base_url}/api/playback-events",
+                     params={'timeout': seconds}, stream=True) as response:
+        for line in response.iter_lines():
+            if line.startswith(b'data: '):
+                yield time.monotonic() - start_time, json.loads(line[6:])
+
+def wait_until_idle(session, base_url, timeout=2):
+    """Return once no device reports Playing, or after `timeout` seconds."""
+    for _, status_data in watch_playback_status(session, base_url, timeout):
+        if status_data['success'] and 'Playing' not in status_data['devices'].values():
+            return
+
+def report_final_status(call):
+    """Check whether the server still reports playback after the files ended."""
+    print("   🔍 Checking if playback is still active...")
+    try:
+        status_data = call('GET', '/api/playback-status')
+        
+        if status_data['success']:
+            is_playing = status_data.get('is_playing', False)
+            print(f"   📊 Final is_playing status: {is_playing}")
+            
+            if not is_playing:
+                print("   ⚠️  System reports not playing - this might indicate auto-stop!")
+            else:
+                print("   ✅ System still reports as playing")
+                
+    except Exception as e:
+        print(f"   ✗ Error checking final status: {e}")
 
 def debug_auto_stop():
     """Debug why the system is auto-stopping."""
     base_url = "http://localhost:5000"
     
+    # One keep-alive connection for every call instead of a new one each time.
+    # Connection drops (e.g. a server restart) and 502/503/504 replies are
+    # retried with backoff; POSTs are only retried if they never reached
+    # the server, so a playback is never started twice.
+    retry = Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504),
+                  allowed_methods=frozenset({'GET'}))
+    session = requests.Session()
+    session.mount(base_url, HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retry))
+    
+    def call(method, path, **kwargs):
+        """Send one API request through the shared session and decode the JSON reply."""
+        return session.request(method, base_url + path, **kwargs).json()
+    
     print("🔍 Debugging Auto-Stop Issue")
     print("=" * 50)
     
     # Get available devices
     print("1. Getting available devices...")
     try:
-        response = requests.get(f"{base_url}/api/devices")
-        data = response.json()
+        data = call('GET', '/api/devices')
         
         if not data['success']:
             print(f"   ✗ Failed to get devices: {data['error']}")
@@ -52,17 +109,14 @@ def debug_auto_stop():
     
     # Test 1: Single-file playback
     print("\n2. Testing Single-File Playback Auto-Stop")
-    test_file = create_short_test_audio_file()
+    test_wav = make_wav_bytes(440)  # A4 note, 3 seconds
     print(f"   ✓ Created 3-second test file")
     
     try:
         # Start single-file playback
         print("   🎵 Starting single-file playback...")
-        with open(test_file, 'rb') as f:
-            files = {'file': ('test.wav', f, 'audio/wav')}
-            response = requests.post(f"{base_url}/api/play-all", files=files)
-        
-        data = response.json()
+        files = {'file': ('test.wav', test_wav, 'audio/wav')}
+        data = call('POST', '/api/play-all', files=files)
         
         if data['success']:
             playback_id = data['playback_id']
@@ -71,76 +125,38 @@ def debug_auto_stop():
             
             # Monitor for 6 seconds (longer than the 3-second file)
             print("   ⏱️  Monitoring for 6 seconds (file is only 3 seconds)...")
-            start_time = time.time()
-            
-            while time.time() - start_time < 6:
-                elapsed = time.time() - start_time
-                
-                # Check playback status
-                try:
-                    status_response = requests.get(f"{base_url}/api/playback-status")
-                    status_data = status_response.json()
-                    
+            finished = 0
+            try:
+                for elapsed, status_data in watch_playback_status(session, base_url, 6):
                     if status_data['success']:
-                        playing_devices = []
-                        finished_devices = []
-                        idle_devices = []
-                        
-                        for device_id, status in status_data['devices'].items():
-                            if status == 'Playing':
-                                playing_devices.append(device_id)
-                            elif status == 'Finished':
-                                finished_devices.append(device_id)
-                            elif status == 'Idle':
-                                idle_devices.append(device_id)
+                        counts = Counter(status_data['devices'].values())
+                        finished = counts['Finished']
                         
-                        print(f"     {elapsed:.1f}s: {len(playing_devices)} playing, {len(finished_devices)} finished, {len(idle_devices)} idle")
+                        print(f"     {elapsed:.1f}s: {counts['Playing']} playing, {finished} finished, {counts['Idle']} idle")
                         print(f"     📊 is_playing: {status_data.get('is_playing', 'N/A')}")
                         
-                        # Check if playback ID still exists
-                        try:
-                            # Try to get playback info (this might fail if auto-cleaned)
-                            # We can't directly check active_playbacks, but we can infer from behavior
-                            pass
-                        except:
-                            pass
-                        
                         # If all devices are finished but system still running, that's good!
-                        if len(finished_devices) > 0 and elapsed > 3.5:
+                        if finished > 0 and elapsed > 3.5:
                             print(f"     ✅ Single-file finished but system still running (no auto-stop)")
                             break
                             
                     else:
                         print(f"     ⚠️  {elapsed:.1f}s: Status check failed")
-                        
-                except Exception as e:
-                    print(f"     ⚠️  {elapsed:.1f}s: Status error: {e}")
                 
-                time.sleep(1)
-            
-            # Check if playback is still active
-            print("   🔍 Checking if playback is still active...")
-            try:
-                status_response = requests.get(f"{base_url}/api/playback-status")
-                status_data = status_response.json()
-                
-                if status_data['success']:
-                    is_playing = status_data.get('is_playing', False)
-                    print(f"   📊 Final is_playing status: {is_playing}")
-                    
-                    if not is_playing:
-                        print("   ⚠️  System reports not playing - this might indicate auto-stop!")
-                    else:
-                        print("   ✅ System still reports as playing")
+                else:
+                    # Events only arrive on changes, so the finished state may
+                    # have been the last one pushed before the window closed
+                    if finished > 0:
+                        print(f"     ✅ Single-file finished but system still running (no auto-stop)")
                         
             except Exception as e:
-                print(f"   ✗ Error checking final status: {e}")
+                print(f"     ⚠️  Status stream error: {e}")
+            
+            report_final_status(call)
             
             # Manually stop single-file playback
             print("   ⏹️  Manually stopping single-file playback...")
-            stop_response = requests.post(f"{base_url}/api/stop-playback", 
-                                       json={'playback_id': playback_id})
-            stop_data = stop_response.json()
+            stop_data = call('POST', '/api/stop-playback', json={'playback_id': playback_id})
             
             if stop_data['success']:
                 print("   ✅ Single-file manual stop successful")
@@ -153,15 +169,12 @@ def debug_auto_stop():
     except Exception as e:
         print(f"   ✗ Error during single-file test: {e}")
     
-    finally:
-        # Clean up test file
-        try:
-            os.unlink(test_file)
-        except:
-            pass
-    
-    # Wait a moment between tests
-    time.sleep(2)
+    # Let the devices settle between tests; the stream returns as soon as
+    # they are idle instead of always sleeping the full two seconds
+    try:
+        wait_until_idle(session, base_url)
+    except Exception:
+        time.sleep(2)
     
     # Test 2: Multi-file playback
     print("\n3. Testing Multi-File Playback Auto-Stop")
@@ -170,17 +183,11 @@ def debug_auto_stop():
     test_files = []
     tones = [(440, "A4"), (523, "C5")]
     
-    for frequency, name in tones:
-        sample_rate = 44100
-        duration = 3.0
-        
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        tone = np.sin(2 * np.pi * frequency * t).astype(np.float32)
-        stereo_tone = np.column_stack([tone, tone])
-        
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-            sf.write(tmp_file.name, stereo_tone, sample_rate)
-            test_files.append((tmp_file.name, name))
+    # NumPy and libsndfile release the GIL, so tones render side by side;
+    # the 440 Hz one comes straight from the single-file test's cache
+    with ThreadPoolExecutor() as executor:
+        rendered = executor.map(make_wav_bytes, [frequency for frequency, _ in tones])
+        test_files.extend(zip(rendered, [name for _, name in tones]))
     
     print(f"   ✓ Created {len(test_files)} short test files (3 seconds each)")
     
@@ -190,21 +197,17 @@ def debug_auto_stop():
         files_data = []
         device_mappings = {}
         
-        for i, (file_path, name) in enumerate(test_files):
+        for i, (wav_bytes, name) in enumerate(test_files):
             if i < len(working_devices):
                 device_id = working_devices[i]['index']
-                files_data.append(('files', (name + '.wav', open(file_path, 'rb'), 'audio/wav')))
+                files_data.append(('files', (name + '.wav', wav_bytes, 'audio/wav')))
                 device_mappings[str(i)] = device_id
         
         form_data = {
-            'device_mappings': str(device_mappings).replace("'", '"')
+            'device_mappings': json.dumps(device_mappings)
         }
         
-        response = requests.post(f"{base_url}/api/play-multi-files", 
-                               files=files_data, 
-                               data=form_data)
-        
-        data = response.json()
+        data = call('POST', '/api/play-multi-files', files=files_data, data=form_data)
         
         if data['success']:
             playback_id = data['playback_id']
@@ -213,68 +216,38 @@ def debug_auto_stop():
             
             # Monitor for 6 seconds (longer than the 3-second files)
             print("   ⏱️  Monitoring for 6 seconds (files are only 3 seconds)...")
-            start_time = time.time()
-            
-            while time.time() - start_time < 6:
-                elapsed = time.time() - start_time
-                
-                # Check playback status
-                try:
-                    status_response = requests.get(f"{base_url}/api/playback-status")
-                    status_data = status_response.json()
-                    
+            finished = 0
+            try:
+                for elapsed, status_data in watch_playback_status(session, base_url, 6):
                     if status_data['success']:
-                        playing_devices = []
-                        finished_devices = []
-                        idle_devices = []
-                        
-                        for device_id, status in status_data['devices'].items():
-                            if status == 'Playing':
-                                playing_devices.append(device_id)
-                            elif status == 'Finished':
-                                finished_devices.append(device_id)
-                            elif status == 'Idle':
-                                idle_devices.append(device_id)
+                        counts = Counter(status_data['devices'].values())
+                        finished = counts['Finished']
                         
-                        print(f"     {elapsed:.1f}s: {len(playing_devices)} playing, {len(finished_devices)} finished, {len(idle_devices)} idle")
+                        print(f"     {elapsed:.1f}s: {counts['Playing']} playing, {finished} finished, {counts['Idle']} idle")
                         print(f"     📊 is_playing: {status_data.get('is_playing', 'N/A')}")
                         
                         # If all devices are finished but system still running, that's good!
-                        if len(finished_devices) == len(test_files) and elapsed > 3.5:
+                        if finished == len(test_files) and elapsed > 3.5:
                             print(f"     ✅ Multi-file finished but system still running (no auto-stop)")
                             break
                             
                     else:
                         print(f"     ⚠️  {elapsed:.1f}s: Status check failed")
-                        
-                except Exception as e:
-                    print(f"     ⚠️  {elapsed:.1f}s: Status error: {e}")
                 
-                time.sleep(1)
-            
-            # Check if playback is still active
-            print("   🔍 Checking if playback is still active...")
-            try:
-                status_response = requests.get(f"{base_url}/api/playback-status")
-                status_data = status_response.json()
-                
-                if status_data['success']:
-                    is_playing = status_data.get('is_playing', False)
-                    print(f"   📊 Final is_playing status: {is_playing}")
-                    
-                    if not is_playing:
-                        print("   ⚠️  System reports not playing - this might indicate auto-stop!")
-                    else:
-                        print("   ✅ System still reports as playing")
+                else:
+                    # Events only arrive on changes, so the finished state may
+                    # have been the last one pushed before the window closed
+                    if finished == len(test_files):
+                        print(f"     ✅ Multi-file finished but system still running (no auto-stop)")
                         
             except Exception as e:
-                print(f"   ✗ Error checking final status: {e}")
+                print(f"     ⚠️  Status stream error: {e}")
+            
+            report_final_status(call)
             
             # Manually stop multi-file playback
             print("   ⏹️  Manually stopping multi-file playback...")
-            stop_response = requests.post(f"{base_url}/api/stop-playback", 
-                                       json={'playback_id': playback_id})
-            stop_data = stop_response.json()
+            stop_data = call('POST', '/api/stop-playback', json={'playback_id': playback_id})
             
             if stop_data['success']:
                 print("   ✅ Multi-file manual stop successful")
@@ -287,14 +260,6 @@ def debug_auto_stop():
     except Exception as e:
         print(f"   ✗ Error during multi-file test: {e}")
     
-    finally:
-        # Clean up test files
-        for file_path, name in test_files:
-            try:
-                os.unlink(file_path)
-            except:
-                pass
-    
     print("\n🎯 Debug Analysis:")
     print("If you see 'System reports not playing' after files finish,")
     print("that indicates the system is auto-stopping when streams finish.")
@@ -1,24 +1,99 @@
 import sys
+import io
 import os
 import tempfile
 import threading
-import requests
+import asyncio
+import atexit
 import time
-import queue
-from gtts import gTTS
-import pygame
-import pyaudio
-import wave
+import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import httpx
 import numpy as np
 import speech_recognition as sr
 
+try:
+    import h2  # httpx only speaks HTTP/2 when h2 is installed
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
+
+try:
+    from faster_whisper import WhisperModel
+except ImportError:
+    WhisperModel = None  # recognize with Google only
+
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QComboBox, QTextEdit, QSizePolicy, QFrame,
     QScrollArea, QGridLayout, QSpacerItem, QProgressBar, QCheckBox
 )
-from PyQt6.QtCore import QObject, pyqtSignal, Qt, QSize, QTimer, QPropertyAnimation, QEasingCurve, QRect, QPoint
-from PyQt6.QtGui import QFont, QIcon, QPixmap, QPainter, QColor, QLinearGradient, QBrush
+from PyQt6.QtCore import QObject, pyqtSignal, Qt, QSize, QTimer, QEasingCurve, QRect, QPoint
+from PyQt6.QtGui import QAction, QFont, QStaticText, QTransform, QIcon, QPixmap, QPainter, QColor, QLinearGradient, QBrush
+
+logger = logging.getLogger(__name__)
+
+# MyMemory translation endpoint
+MYMEMORY_URL = "https://api.mymemory.translated.net/get"
+
+# Network I/O runs as coroutines on one background event loop, so all
+# translations for an utterance overlap on one keep-alive connection
+# (multiplexed when HTTP/2 is available) without a thread per request
+LOOP = asyncio.new_event_loop()
+threading.Thread(target=LOOP.run_forever, name="net-loop", daemon=True).start()
+_client = None
+
+def get_client():
+    """Shared keep-alive client; only call from coroutines on LOOP."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            http2=HTTP2,
+            timeout=10,
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+        )
+    return _client
+
+def run_async(coro):
+    """Schedule a coroutine on LOOP from any thread."""
+    return asyncio.run_coroutine_threadsafe(coro, LOOP)
+
+async def _close_client():
+    if _client is not None:
+        await _client.aclose()
+
+def close_network():
+    try:
+        run_async(_close_client()).result(timeout=2)
+    except Exception:
+        pass
+    LOOP.call_soon_threadsafe(LOOP.stop)
+
+atexit.register(close_network)
+
+# Translation memory: recent (text, target) results, least recently used dropped first
+TM_CACHE_MAX = 512
+# Translations arriving this close together are applied to the cards in one pass
+TRANSLATION_FLUSH_MS = 10
+
+# Decoded speech kept in memory per (text, language) for instant replays
+TTS_CACHE_MAX_SOUNDS = 32
+
+# Local speech recognition (used when faster-whisper is installed, unless --remote)
+WHISPER_MODEL_SIZE = "small"
+WHISPER_SAMPLE_RATE = 16000
+
+# Recording: captured at Whisper's rate straight into a preallocated buffer
+MAX_RECORD_SECONDS = 10
+LISTEN_TIMEOUT = 5        # seconds to wait for speech to begin
+PHRASE_TIME_LIMIT = 5     # longest phrase kept, in seconds
+PREROLL_SECONDS = 0.3     # audio kept from just before speech starts
+
+# Input level meter: samples kept for the meter and how often it refreshes
+LEVEL_RING_SAMPLES = 32768
+METER_INTERVAL_MS = 50
+METER_FULL_SCALE = 8000   # mean |sample| shown as a full bar
 
 class Signals(QObject):
     """Custom signals for thread-safe UI updates"""
@@ -28,17 +103,87 @@ class Signals(QObject):
     set_button_enabled = pyqtSignal(bool)
     tts_ready = pyqtSignal(str, str)
     all_translations_done = pyqtSignal()
+    recording_finished = pyqtSignal()
+
+class LevelRing:
+    """Lock-free single-producer/single-consumer ring of int16 samples.
+
+    The recording thread is the only writer and the Qt meter timer the only
+    reader; each side owns one cursor, so no lock or per-chunk allocation
+    is needed on the audio path.
+    """
+    
+    def __init__(self, size=LEVEL_RING_SAMPLES):
+        self.buf = np.zeros(size, dtype=np.int16)
+        self.size = size
+        self.w = 0
+        self.r = 0
+    
+    def write(self, data):
+        samples = np.frombuffer(data, dtype=np.int16)[-self.size:]
+        n = len(samples)
+        start = self.w % self.size
+        first = min(n, self.size - start)
+        self.buf[start:start + first] = samples[:first]
+        self.buf[:n - first] = samples[first:]
+        # Publish only after the copy so the reader never sees unwritten samples
+        self.w += n
+    
+    def read_level(self):
+        """Mean absolute amplitude of the samples written since the last read"""
+        w = self.w
+        n = min(w - self.r, self.size)
+        self.r = w
+        if n <= 0:
+            return None
+        start = (w - n) % self.size
+        if start + n <= self.size:
+            chunk = self.buf[start:start + n]
+        else:
+            chunk = np.concatenate((self.buf[start:], self.buf[:start + n - self.size]))
+        return float(np.abs(chunk.astype(np.int32)).mean())
+
+class MeteredStream:
+    """Microphone stream wrapper that copies every chunk it reads into a LevelRing"""
+    
+    def __init__(self, stream, ring):
+        self.stream = stream
+        self.ring = ring
+    
+    def read(self, size):
+        data = self.stream.read(size)
+        self.ring.write(data)
+        return data
+    
+    def close(self):
+        self.stream.close()
 
 class ToggleSwitch(QWidget):
     """Custom toggle switch widget"""
     toggled = pyqtSignal(bool)
     
+    # Language icons mapping
+    language_icons = {
+        "Japanese": "🇯🇵",
+        "Chinese": "🇨🇳", 
+        "Vietnamese": "🇻🇳",
+        "English": "🇺🇸",
+        "Korean": "🇰🇷"
+    }
+    
+    # All toggles animate off one shared 60 Hz timer; the easing curves are
+    # sampled once into lookup tables instead of evaluated per frame
+    ANIMATION_SECONDS = 0.3
+    _position_lut = tuple(QEasingCurve(QEasingCurve.Type.OutBack).valueForProgress(i / 255) for i in range(256))
+    _opacity_lut = tuple(QEasingCurve(QEasingCurve.Type.OutCubic).valueForProgress(i / 255) for i in range(256))
+    _anim_timer = None
+    _active = set()
+    
     def __init__(self, text="", icon="", parent=None):
         super().__init__(parent)
         self.text = text
         self.icon = icon
         self.checked = False
-        self.animation = None
         self.setFixedSize(140, 35)
         
         # Colors
@@ -51,15 +196,20 @@ class ToggleSwitch(QWidget):
         self.target_position = 3
         self.background_opacity = 0.3
         self.target_opacity = 0.3
+        self._anim_start = 0.0
+        self._from_position = 3
+        self._from_opacity = 0.3
+        
+        # Pre-rendered layers, indexed by self.checked (built on first paint)
+        self._bg_cache_off = None
+        self._bg_cache_on = None
+        self._bg_caches = None
+        self._label_cache = None
         
-        # Language icons mapping
-        self.language_icons = {
-            "Japanese": "🇯🇵",
-            "Chinese": "🇨🇳", 
-            "Vietnamese": "🇻🇳",
-            "English": "🇺🇸",
-            "Korean": "🇰🇷"
-        }
+        # Flag and label text, shaped once and reused whenever the layers are rebuilt
+        self._label_font = QFont('Arial', 10)
+        self._static_text = QStaticText()
+        self._prepare_static_text()
         
     def setChecked(self, checked):
         if self.checked != checked:
@@ -71,58 +221,108 @@ class ToggleSwitch(QWidget):
             
     def isChecked(self):
         return self.checked
+    
+    def setText(self, text):
+        if text != self.text:
+            self.text = text
+            self._prepare_static_text()
+            self._bg_caches = None
+            self.update()
+    
+    def _prepare_static_text(self):
+        self._static_text.setText(f"{self.language_icons.get(self.text, '')} {self.text}")
+        self._static_text.prepare(QTransform(), self._label_font)
         
     def start_animation(self):
-        if self.animation:
-            self.animation.stop()
-            
-        self.animation = QPropertyAnimation(self, b"thumb_position")
-        self.animation.setDuration(300)
-        self.animation.setEasingCurve(QEasingCurve.Type.OutBack)
-        self.animation.setStartValue(self.thumb_position)
-        self.animation.setEndValue(self.target_position)
-        self.animation.valueChanged.connect(self.update)
-        self.animation.finished.connect(self.on_animation_finished)
-        
-        self.bg_animation = QPropertyAnimation(self, b"background_opacity")
-        self.bg_animation.setDuration(300)
-        self.bg_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-        self.bg_animation.setStartValue(self.background_opacity)
-        self.bg_animation.setEndValue(self.target_opacity)
-        self.bg_animation.valueChanged.connect(self.update)
-        
-        self.animation.start()
-        self.bg_animation.start()
-        
-    def on_animation_finished(self):
-        self.thumb_position = self.target_position
-        self.background_opacity = self.target_opacity
-        
+        self._anim_start = time.monotonic()
+        self._from_position = self.thumb_position
+        self._from_opacity = self.background_opacity
+        
+        cls = ToggleSwitch
+        cls._active.add(self)
+        if cls._anim_timer is None:
+            cls._anim_timer = QTimer()
+            cls._anim_timer.setInterval(16)
+            cls._anim_timer.timeout.connect(cls._tick)
+        if not cls._anim_timer.isActive():
+            cls._anim_timer.start()
+        
+    @classmethod
+    def _tick(cls):
+        """Advance every animating toggle by one frame"""
+        now = time.monotonic()
+        for toggle in list(cls._active):
+            t = (now - toggle._anim_start) / cls.ANIMATION_SECONDS
+            if t >= 1.0:
+                toggle.thumb_position = toggle.target_position
+                toggle.background_opacity = toggle.target_opacity
+                cls._active.discard(toggle)
+            else:
+                i = int(t * 255)
+                toggle.thumb_position = toggle._from_position + (toggle.target_position - toggle._from_position) * cls._position_lut[i]
+                toggle.background_opacity = toggle._from_opacity + (toggle.target_opacity - toggle._from_opacity) * cls._opacity_lut[i]
+            toggle.update()
+        
+        if not cls._active:
+            cls._anim_timer.stop()
+        
+    def _render_layer(self, color):
+        """Paint the pill background in color into a device-pixel pixmap"""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setBrush(color)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.drawRoundedRect(3, 5, 55, 24, 14, 14)
+        painter.end()
+        return pixmap
+
+    def _rebuild_bg_cache(self):
+        """Render the on/off backgrounds once; only the thumb moves per frame"""
+        self._bg_cache_off = self._render_layer(self.bg_color_off)
+        self._bg_cache_on = self._render_layer(self.bg_color_on)
+        self._bg_caches = (self._bg_cache_off, self._bg_cache_on)
+        
+        # Flag and label are drawn at full opacity, so they get their own layer
+        dpr = self.devicePixelRatioF()
+        self._label_cache = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        self._label_cache.setDevicePixelRatio(dpr)
+        self._label_cache.fill(Qt.GlobalColor.transparent)
+        if self.text:
+            painter = QPainter(self._label_cache)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(QColor(100, 100, 100))
+            painter.setFont(self._label_font)
+            painter.drawStaticText(65, 10, self._static_text)
+            painter.end()
+
+    def resizeEvent(self, event):
+        self._bg_caches = None
+        super().resizeEvent(event)
+
     def paintEvent(self, event):
+        if self._bg_caches is None or self._bg_cache_on.devicePixelRatio() != self.devicePixelRatioF():
+            self._rebuild_bg_cache()
+        
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # Draw toggle button background
-        toggle_bg_color = self.bg_color_on if self.checked else self.bg_color_off
-        toggle_bg_color.setAlphaF(self.background_opacity)
-        painter.setBrush(toggle_bg_color)
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawRoundedRect(3, 5, 55, 24, 14, 14)
+        painter.setOpacity(self.background_opacity)
+        painter.drawPixmap(0, 0, self._bg_caches[self.checked])
+        painter.setOpacity(1.0)
         
         # Draw thumb
-        thumb_size = 18
-        thumb_rect = QRect(int(self.thumb_position), 8, thumb_size, thumb_size)
-        
         painter.setBrush(self.thumb_color)
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawEllipse(thumb_rect)
+        painter.drawEllipse(QRect(int(self.thumb_position), 8, 18, 18))
         
         # Draw text and icon
-        if self.text:
-            icon_text = self.language_icons.get(self.text, "")
-            painter.setPen(QColor(100, 100, 100))
-            painter.setFont(QFont('Arial', 10))
-            painter.drawText(65, 20, f"{icon_text} {self.text}")
+        painter.drawPixmap(0, 0, self._label_cache)
     
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
@@ -138,19 +338,54 @@ class IntegratedMainWindow(QMainWindow):
         # Initialize signals
         self.signals = Signals()
         self.target_languages = ['en', 'ja', 'zh-cn', 'vi']
-        self.selected_targets = ['en']  # Default to English
+        self.selected_targets = {'en'}  # Default to English
+        
+        # Long-lived workers: background jobs (model loading, replay) share a
+        # small pool and recordings run one at a time
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="io")
+        self._rec_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rec")
+        
+        # Translation memory so repeated phrases skip the network
+        self._tm_cache = OrderedDict()
+        self._tm_lock = threading.Lock()
+        
+        # gTTS output cache and the latest translation per language for replay
+        self._tts_index = OrderedDict()
+        self._tts_lock = threading.Lock()
+        self._last_translations = {}
         
         # Initialize audio components
-        self.audio_queue = queue.Queue()
+        self._level_ring = LevelRing()
         self.is_recording = False
-        self.audio_frames = []
+        self._rec_buf = np.empty(WHISPER_SAMPLE_RATE * MAX_RECORD_SECONDS, dtype=np.int16)
+        self._rec_len = 0
         
         # Initialize speech recognition
         self.recognizer = sr.Recognizer()
-        self.microphone = sr.Microphone()
-        
-        # Initialize pygame for audio playback
-        pygame.mixer.init()
+        self.recognizer.dynamic_energy_threshold = False  # keep the calibrated threshold
+        self.microphone = None  # opened on first use; probing PortAudio is slow
+        self._noise_calibrated = False
+        
+        # Local Whisper model, loaded in the background on the first recording
+        self.use_remote_asr = WhisperModel is None or '--remote' in sys.argv
+        self._asr = None
+        self._asr_lock = threading.Lock()
+        self._utterance_audio = None  # samples of the utterance last transcribed locally
+        
+        # pygame and gTTS are imported and the mixer opened on first playback
+        self._audio_ready = False
+        self._audio_lock = threading.Lock()
+        
+        # Text label of each translation card, by language code
+        self._text_labels = {}
+        
+        # Translations waiting for the next coalesced card update
+        self._pending_translations = {}
+        self._awaiting_targets = set()
+        self._translation_flush = QTimer(self)
+        self._translation_flush.setSingleShot(True)
+        self._translation_flush.setInterval(TRANSLATION_FLUSH_MS)
+        self._translation_flush.timeout.connect(self.flush_translations)
         
         # Initialize UI
         self.init_ui()
@@ -177,6 +412,8 @@ class IntegratedMainWindow(QMainWindow):
         
         # Create the main content container
         self.create_main_container(main_layout)
+        
+        self.create_menu()
 
     def create_main_container(self, parent_layout):
         """Create the main content container with responsive design"""
@@ -222,6 +459,13 @@ class IntegratedMainWindow(QMainWindow):
         # Status section
         self.create_status_section(parent_layout)
 
+    def create_menu(self):
+        """Create the menu bar"""
+        audio_menu = self.menuBar().addMenu("Audio")
+        recalibrate_action = QAction("Recalibrate noise", self)
+        recalibrate_action.triggered.connect(self.recalibrate_noise)
+        audio_menu.addAction(recalibrate_action)
+
     def create_from_section(self, parent_layout):
         """Create the 'From' language selection section"""
         from_layout = QHBoxLayout()
@@ -256,20 +500,20 @@ class IntegratedMainWindow(QMainWindow):
         cards_layout.setSpacing(15)
         
         # English card
-        self.english_card = self.create_translation_card("English", "🇺🇸", "Translation will appear here...")
+        self.english_card, self._text_labels['en'] = self.create_translation_card("English", "🇺🇸", "Translation will appear here...")
         cards_layout.addWidget(self.english_card)
         
         # Add stretch for responsive spacing
         cards_layout.addStretch()
         
         # Japanese card
-        self.japanese_card = self.create_translation_card("Japanese", "🇯🇵", "Translation will appear here...")
+        self.japanese_card, self._text_labels['ja'] = self.create_translation_card("Japanese", "🇯🇵", "Translation will appear here...")
         cards_layout.addWidget(self.japanese_card)
         
         parent_layout.addLayout(cards_layout)
 
     def create_translation_card(self, language, flag, text):
-        """Create a translation output card"""
+        """Create a translation output card; returns the card and its text label"""
         card = QFrame()
         card.setStyleSheet("""
             QFrame {
@@ -303,12 +547,11 @@ class IntegratedMainWindow(QMainWindow):
         text_label.setFont(QFont('Arial', 11))
         text_label.setStyleSheet("color: #666;")
         text_label.setWordWrap(True)
-        text_label.setObjectName(f"{language.lower()}_text")
         
         card_layout.addLayout(header_layout)
         card_layout.addWidget(text_label)
         
-        return card
+        return card, text_label
 
     def create_microphone_section(self, parent_layout):
         """Create the central microphone button section"""
@@ -343,6 +586,28 @@ class IntegratedMainWindow(QMainWindow):
         mic_layout.addStretch()
         
         parent_layout.addLayout(mic_layout)
+        
+        # Input level meter, polled from the level ring while recording
+        self.level_meter = QProgressBar()
+        self.level_meter.setRange(0, 100)
+        self.level_meter.setTextVisible(False)
+        self.level_meter.setFixedSize(200, 6)
+        self.level_meter.setStyleSheet("""
+            QProgressBar {
+                background-color: #e0e0e0;
+                border-radius: 3px;
+                border: none;
+            }
+            QProgressBar::chunk {
+                background-color: #4CAF50;
+                border-radius: 3px;
+            }
+        """)
+        parent_layout.addWidget(self.level_meter, alignment=Qt.AlignmentFlag.AlignHCenter)
+        
+        self.meter_timer = QTimer(self)
+        self.meter_timer.setInterval(METER_INTERVAL_MS)
+        self.meter_timer.timeout.connect(self.update_level_meter)
 
     def create_to_section(self, parent_layout):
         """Create the 'To' language selection section with toggle switches"""
@@ -384,13 +649,13 @@ class IntegratedMainWindow(QMainWindow):
         additional_layout.setSpacing(15)
         
         # Chinese card
-        self.chinese_card = self.create_translation_card("Chinese", "🇨🇳", "Translation will appear here...")
+        self.chinese_card, self._text_labels['zh-cn'] = self.create_translation_card("Chinese", "🇨🇳", "Translation will appear here...")
         additional_layout.addWidget(self.chinese_card)
         
         additional_layout.addStretch()
         
         # Vietnamese card
-        self.vietnamese_card = self.create_translation_card("Vietnamese", "🇻🇳", "Translation will appear here...")
+        self.vietnamese_card, self._text_labels['vi'] = self.create_translation_card("Vietnamese", "🇻🇳", "Translation will appear here...")
         additional_layout.addWidget(self.vietnamese_card)
         
         parent_layout.addLayout(additional_layout)
@@ -439,13 +704,11 @@ class IntegratedMainWindow(QMainWindow):
     def toggle_language(self, language_code, checked):
         """Toggle language selection"""
         if checked:
-            if language_code not in self.selected_targets:
-                self.selected_targets.append(language_code)
+            self.selected_targets.add(language_code)
         else:
-            if language_code in self.selected_targets:
-                self.selected_targets.remove(language_code)
+            self.selected_targets.discard(language_code)
         
-        print(f"Selected languages: {self.selected_targets}")
+        logger.debug("Selected languages: %s", self.selected_targets)
 
     def start_recording(self):
         """Start recording process"""
@@ -465,9 +728,13 @@ class IntegratedMainWindow(QMainWindow):
         self.mic_button.setText("🔴")
         self.status_label.setText("Recording... Speak now!")
         
-        # Start recording in a separate thread
-        self.recording_thread = threading.Thread(target=self.record_audio, daemon=True)
-        self.recording_thread.start()
+        # Record on the dedicated recording worker; the first recording also
+        # measures background noise before it listens
+        self._rec_pool.submit(self.record_audio)
+        # Load the Whisper model while the user speaks rather than at startup
+        if not self.use_remote_asr and self._asr is None:
+            self._io_pool.submit(self.get_asr_model)
+        self.meter_timer.start()
 
     def stop_recording(self):
         """Stop recording process"""
@@ -482,57 +749,236 @@ class IntegratedMainWindow(QMainWindow):
         """)
         self.mic_button.setText("🎤")
         self.status_label.setText("Processing...")
+        self.meter_timer.stop()
+        self.level_meter.setValue(0)
+
+    def update_level_meter(self):
+        """Show the input level of the audio captured since the last tick"""
+        level = self._level_ring.read_level()
+        if level is not None:
+            self.level_meter.setValue(min(100, int(level * 100 / METER_FULL_SCALE)))
+
+    def get_microphone(self):
+        """Open the microphone on first use (only called on the recording worker)"""
+        if self.microphone is None:
+            self.microphone = sr.Microphone(sample_rate=WHISPER_SAMPLE_RATE)
+        return self.microphone
+
+    def calibrate_noise(self):
+        """Set the recognizer's energy threshold from a short sample of room noise"""
+        try:
+            with self.get_microphone() as source:
+                self.recognizer.adjust_for_ambient_noise(source, duration=0.8)
+            self._noise_calibrated = True
+        except Exception as e:
+            self.signals.set_status.emit(f"Noise calibration error: {e}")
+
+    def recalibrate_noise(self):
+        """Measure the background noise again before the next recording"""
+        self._noise_calibrated = False
+        self.status_label.setText("Calibrating noise... stay quiet")
+        self._rec_pool.submit(self.calibrate_noise)
+        self._rec_pool.submit(self.signals.set_status.emit, "Ready to record")
 
     def record_audio(self):
         """Record audio using speech recognition"""
         try:
-            with self.microphone as source:
-                self.recognizer.adjust_for_ambient_noise(source)
-                self.status_label.setText("Listening...")
+            with self.get_microphone() as source:
+                source.stream = MeteredStream(source.stream, self._level_ring)
+                if not self._noise_calibrated:
+                    self.recognizer.adjust_for_ambient_noise(source, duration=0.8)
+                    self._noise_calibrated = True
+                self.signals.set_status.emit("Listening...")
                 
                 # Record for up to 5 seconds or until silence
-                audio = self.recognizer.listen(source, timeout=5, phrase_time_limit=5)
-                
-                self.status_label.setText("Processing speech...")
+                pcm = self.capture_phrase(source)
                 
-                # Recognize speech
-                try:
-                    text = self.recognizer.recognize_google(audio, language='ko-KR')  # Korean
-                    self.signals.transcription_ready.emit(text)
-                except sr.UnknownValueError:
-                    self.signals.set_status.emit("Could not understand audio")
-                except sr.RequestError as e:
-                    self.signals.set_status.emit(f"Error: {e}")
+            # Hand the captured PCM straight to recognition; no temp WAV file
+            self.signals.set_status.emit("Processing speech...")
+            self.recognize_from_np(pcm, WHISPER_SAMPLE_RATE)
                     
+        except sr.WaitTimeoutError:
+            self.signals.set_status.emit("No speech detected")
         except Exception as e:
             self.signals.set_status.emit(f"Recording error: {e}")
         finally:
-            self.stop_recording()
+            self.signals.recording_finished.emit()
+
+    def capture_phrase(self, source):
+        """Read one phrase from source into the preallocated int16 buffer.
+
+        Chunks are written in place, so there is no list of frames to join;
+        the returned array is a view of the buffer trimmed to the phrase.
+        """
+        rate = source.SAMPLE_RATE
+        chunk_seconds = source.CHUNK / rate
+        threshold = self.recognizer.energy_threshold
+        pause_chunks = int(self.recognizer.pause_threshold / chunk_seconds) + 1
+        preroll = int(PREROLL_SECONDS * rate)
+        buf = self._rec_buf
+        
+        self._rec_len = 0
+        speech_start = None
+        silent_chunks = 0
+        waited = 0.0
+        while self.is_recording:
+            data = np.frombuffer(source.stream.read(source.CHUNK), dtype=np.int16)
+            n = min(len(data), len(buf) - self._rec_len)
+            buf[self._rec_len:self._rec_len + n] = data[:n]
+            self._rec_len += n
+            
+            samples = data.astype(np.float32)
+            loud = np.sqrt(np.dot(samples, samples) / max(len(samples), 1)) > threshold
+            if speech_start is None:
+                if loud:
+                    speech_start = max(0, self._rec_len - n - preroll)
+                else:
+                    waited += chunk_seconds
+                    if waited > LISTEN_TIMEOUT:
+                        raise sr.WaitTimeoutError("listening timed out while waiting for phrase to start")
+                    # Only the pre-roll before speech is worth keeping
+                    if self._rec_len > len(buf) // 2:
+                        buf[:preroll] = buf[self._rec_len - preroll:self._rec_len]
+                        self._rec_len = preroll
+                continue
+            
+            silent_chunks = 0 if loud else silent_chunks + 1
+            if (silent_chunks >= pause_chunks
+                    or self._rec_len - speech_start >= PHRASE_TIME_LIMIT * rate
+                    or self._rec_len == len(buf)):
+                break
+        
+        return buf[speech_start or 0:self._rec_len]
+
+    def recognize_from_np(self, pcm_int16, sample_rate):
+        """Recognize 16-bit mono PCM held in a numpy array"""
+        audio = sr.AudioData(pcm_int16.tobytes(), sample_rate, 2)
+        self.recognize_audio(audio, pcm_int16 if sample_rate == WHISPER_SAMPLE_RATE else None)
+
+    def get_asr_model(self):
+        """Load the local Whisper model once, switching to remote ASR if it fails"""
+        with self._asr_lock:
+            if self._asr is None:
+                try:
+                    self._asr = WhisperModel(WHISPER_MODEL_SIZE, device="cpu", compute_type="int8")
+                except Exception:
+                    logger.exception("Could not load Whisper model, using Google ASR")
+                    self.use_remote_asr = True
+                    raise
+        return self._asr
+
+    def transcribe_local(self, audio, pcm=None):
+        """Transcribe an sr.AudioData with the local Whisper model.
+
+        Returns the text and the float32 samples, which translate_text hands
+        to translate_english_local when English is a target.
+        """
+        if pcm is None:
+            raw = audio.get_raw_data(convert_rate=WHISPER_SAMPLE_RATE, convert_width=2)
+            pcm = np.frombuffer(raw, dtype=np.int16)
+        audio_np = pcm.astype(np.float32) / 32768.0
+        
+        segments, _ = self.get_asr_model().transcribe(audio_np, language="ko", beam_size=1, vad_filter=True)
+        return "".join(segment.text for segment in segments).strip(), audio_np
+
+    def translate_english_local(self, text, audio_np):
+        """Produce the English translation with Whisper's translate task.
+
+        Runs on the io pool after the Korean text is out, so it never delays
+        the transcription or the other targets; falls back to MyMemory.
+        """
+        key = (text, 'en')
+        with self._tm_lock:
+            english = self._tm_cache.get(key)
+        try:
+            if english is None:
+                segments, _ = self.get_asr_model().transcribe(
+                    audio_np, language="ko", task="translate", beam_size=1, vad_filter=True)
+                english = "".join(segment.text for segment in segments).strip()
+                if english:
+                    self.remember_translation(text, 'en', english)
+        except Exception:
+            english = None
+        
+        if english:
+            self.signals.translation_ready.emit(english, 'en')
+        else:
+            run_async(self.translate_to_language(text, 'en'))
+
+    def recognize_audio(self, audio, pcm=None):
+        """Transcribe an sr.AudioData and emit the recognized text.
+
+        pcm, when given, is the same audio as 16 kHz int16 samples and lets
+        the local model skip decoding it again.
+        """
+        try:
+            if self.use_remote_asr:
+                text = self.recognizer.recognize_google(audio, language='ko-KR')  # Korean
+            else:
+                try:
+                    text, self._utterance_audio = self.transcribe_local(audio, pcm)
+                except Exception as e:
+                    logger.warning("Local transcription failed, trying Google: %s", e)
+                    self._utterance_audio = None
+                    text = self.recognizer.recognize_google(audio, language='ko-KR')
+                if not text:
+                    raise sr.UnknownValueError()
+            self.signals.transcription_ready.emit(text)
+        except sr.UnknownValueError:
+            self.signals.set_status.emit("Could not understand audio")
+        except sr.RequestError as e:
+            self.signals.set_status.emit(f"Error: {e}")
+        except Exception as e:
+            self.signals.set_status.emit(f"Recognition error: {e}")
 
     def translate_text(self, text):
         """Translate text to selected languages"""
-        for lang_code in self.selected_targets:
-            threading.Thread(
-                target=self.translate_to_language,
-                args=(text, lang_code),
-                daemon=True
-            ).start()
-
-    def translate_to_language(self, text, target_lang):
+        self._awaiting_targets = set(self.selected_targets)
+        targets = sorted(self.selected_targets)
+        
+        # With local ASR, English comes from Whisper's translate task instead
+        audio_np, self._utterance_audio = self._utterance_audio, None
+        if audio_np is not None and 'en' in self.selected_targets:
+            targets.remove('en')
+            self._io_pool.submit(self.translate_english_local, text, audio_np)
+        
+        run_async(self.translate_all(text, targets))
+
+    async def translate_all(self, text, targets):
+        """Translate text to every target concurrently on the network loop"""
+        await asyncio.gather(*(self.translate_to_language(text, code) for code in targets))
+
+    def remember_translation(self, text, target_lang, translated_text):
+        """Store a translation in the translation memory"""
+        with self._tm_lock:
+            self._tm_cache[(text, target_lang)] = translated_text
+            if len(self._tm_cache) > TM_CACHE_MAX:
+                self._tm_cache.popitem(last=False)
+
+    async def translate_to_language(self, text, target_lang):
         """Translate text to a specific language"""
+        key = (text, target_lang)
+        with self._tm_lock:
+            cached = self._tm_cache.get(key)
+            if cached is not None:
+                self._tm_cache.move_to_end(key)
+        if cached is not None:
+            self.signals.translation_ready.emit(cached, target_lang)
+            return
+        
         try:
             # Using MyMemory API for translation
-            url = "https://api.mymemory.translated.net/get"
             params = {
                 'q': text,
                 'langpair': f'ko|{target_lang}'
             }
             
-            response = requests.get(url, params=params)
+            response = await get_client().get(MYMEMORY_URL, params=params)
             data = response.json()
             
             if data['responseStatus'] == 200:
                 translated_text = data['responseData']['translatedText']
+                self.remember_translation(text, target_lang, translated_text)
                 self.signals.translation_ready.emit(translated_text, target_lang)
             else:
                 self.signals.set_status.emit(f"Translation error for {target_lang}")
@@ -540,12 +986,64 @@ class IntegratedMainWindow(QMainWindow):
         except Exception as e:
             self.signals.set_status.emit(f"Translation error: {e}")
 
+    def _ensure_audio_ready(self):
+        """Import pygame and open the mixer the first time audio is played"""
+        import pygame
+        with self._audio_lock:
+            if not self._audio_ready:
+                pygame.mixer.init()
+                self._audio_ready = True
+        return pygame
+
+    def synthesize(self, text, lang):
+        """Return a pygame Sound of text spoken in lang, synthesizing it on a miss.
+
+        The MP3 never touches the disk: gTTS writes into memory and pygame
+        decodes it once, so a repeat replay reuses the decoded samples.
+        """
+        key = (text, lang)
+        with self._tts_lock:
+            sound = self._tts_index.get(key)
+            if sound is not None:
+                self._tts_index.move_to_end(key)
+                return sound
+        
+        from gtts import gTTS
+        pygame = self._ensure_audio_ready()
+        
+        mp3 = io.BytesIO()
+        gTTS(text=text, lang=lang).write_to_fp(mp3)
+        mp3.seek(0)
+        sound = pygame.mixer.Sound(file=mp3)
+        
+        with self._tts_lock:
+            self._tts_index[key] = sound
+            if len(self._tts_index) > TTS_CACHE_MAX_SOUNDS:
+                self._tts_index.popitem(last=False)
+        return sound
+
+    def play_translations(self, items):
+        """Speak each (lang, text) pair in turn"""
+        try:
+            for lang, text in items:
+                sound = self.synthesize(text, lang)
+                channel = sound.play()
+                while channel is not None and channel.get_busy():
+                    time.sleep(0.05)
+            self.signals.set_status.emit("Ready to record")
+        except Exception as e:
+            self.signals.set_status.emit(f"Playback error: {e}")
+
     def replay_audio(self):
-        """Replay audio functionality"""
+        """Replay the latest translations for the selected languages"""
+        items = [(code, self._last_translations[code])
+                 for code in sorted(self.selected_targets) if code in self._last_translations]
+        if not items:
+            self.status_label.setText("Nothing to replay yet")
+            return
+        
         self.status_label.setText("Playing audio...")
-        # This would play the last translated text
-        # For now, just show a message
-        QTimer.singleShot(2000, lambda: self.status_label.setText("Ready to record"))
+        self._io_pool.submit(self.play_translations, items)
 
     def connect_signals(self):
         """Connect custom signals"""
@@ -553,11 +1051,14 @@ class IntegratedMainWindow(QMainWindow):
         self.signals.translation_ready.connect(self.handle_translation)
         self.signals.set_status.connect(self.status_label.setText)
         self.signals.set_button_enabled.connect(self.mic_button.setEnabled)
+        self.signals.recording_finished.connect(self.stop_recording)
+        self.signals.all_translations_done.connect(lambda: self.status_label.setText("Translation complete!"))
 
     def handle_transcription(self, text):
         """Handle transcribed text"""
         # Update source text display
         self.source_lang_label.setText(f"Korean 🇰🇷: {text}")
+        self._last_translations.clear()
         
         # Start translation
         self.translate_text(text)
@@ -565,22 +1066,36 @@ class IntegratedMainWindow(QMainWindow):
 
     def handle_translation(self, translated_text, lang_code):
         """Handle translated text"""
-        # Update the appropriate card based on language code
-        lang_mapping = {
-            'en': 'english',
-            'ja': 'japanese', 
-            'zh-cn': 'chinese',
-            'vi': 'vietnamese'
-        }
-        
-        if lang_code in lang_mapping:
-            card_name = lang_mapping[lang_code]
-            # Find the text label in the corresponding card
-            text_widget = self.findChild(QLabel, f"{card_name}_text")
-            if text_widget:
-                text_widget.setText(translated_text)
-        
-        self.status_label.setText("Translation complete!")
+        self._last_translations[lang_code] = translated_text
+        
+        # Results that arrive together are applied in one layout/paint pass
+        self._pending_translations[lang_code] = translated_text
+        if not self._translation_flush.isActive():
+            self._translation_flush.start()
+
+    def flush_translations(self):
+        """Apply every pending translation to its card"""
+        pending, self._pending_translations = self._pending_translations, {}
+        self.setUpdatesEnabled(False)
+        try:
+            for lang_code, translated_text in pending.items():
+                # Update the appropriate card based on language code
+                text_widget = self._text_labels.get(lang_code)
+                if text_widget:
+                    text_widget.setText(translated_text)
+        finally:
+            self.setUpdatesEnabled(True)
+        
+        if self._awaiting_targets:
+            self._awaiting_targets.difference_update(pending)
+            if not self._awaiting_targets:
+                self.signals.all_translations_done.emit()
+
+    def closeEvent(self, event):
+        """Stop the worker pools without waiting on in-flight requests"""
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self._rec_pool.shutdown(wait=False, cancel_futures=True)
+        super().closeEvent(event)
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
@@ -0,0 +1,28 @@
+# Shared language tables for the translator UIs.
+# Display name -> ISO code (Google Translate / MyMemory / gTTS).
+# You can expand this map to whatever you need.
+
+LANGS = {
+    "English": "en",
+    "Korean": "ko",
+    "Vietnamese": "vi",
+    "Burmese": "my",
+    "Khmer": "km",
+    "Chinese (Simplified)": "zh",
+    "Japanese": "ja",
+    "French": "fr",
+    "Spanish": "es"
+}
+
+# helper to map for Google recognizer language tags
+RECOGNIZER_LANG_TAG = {
+    "ko": "ko-KR",
+    "en": "en-US",
+    "vi": "vi-VN",
+    "my": "my-MM",   # might not be supported by recognizer
+    "km": "km-KH",   # might not be supported
+    "zh": "zh-CN",
+    "ja": "ja-JP",
+    "fr": "fr-FR",
+    "es": "es-ES"
+}
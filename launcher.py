@@ -2,15 +2,40 @@
 """
 Multi-Device Audio Launcher
 Simple launcher script for the multi-device audio system.
+Pass --isolated to run each choice in its own Python process.
 """
 
 import sys
 import os
+import importlib
 import subprocess
 
 
+def run_module(name, *args, isolated=False):
+    """Run a sibling script's main() in this interpreter.
+
+    Importing saves starting a second Python and reloading numpy/Qt for
+    every choice; with isolated=True the script runs in its own process.
+    """
+    if isolated:
+        subprocess.run([sys.executable, f"{name}.py", *args])
+        return
+    
+    module = importlib.import_module(name)
+    try:
+        if args:
+            module.main(list(args))
+        else:
+            module.main()
+    except SystemExit:
+        # The scripts end with sys.exit(); keep the launcher menu running
+        pass
+
+
 def main():
     """Main launcher function."""
+    isolated = "--isolated" in sys.argv[1:]
+    
     print("=== Multi-Device Audio System ===")
     print("Choose an option:")
     print("1. GUI Interface (Recommended)")
@@ -29,7 +54,7 @@ def main():
                 break
             elif choice == "1":
                 print("Starting GUI interface...")
-                subprocess.run([sys.executable, "multi_device_gui.py"])
+                run_module("multi_device_gui", isolated=isolated)
             elif choice == "2":
                 print("Starting CLI interface...")
                 print("Usage examples:")
@@ -39,13 +64,13 @@ def main():
                 break
             elif choice == "3":
                 print("Running demo script...")
-                subprocess.run([sys.executable, "multi_device_demo.py"])
+                run_module("multi_device_demo", isolated=isolated)
             elif choice == "4":
                 print("Listing devices...")
-                subprocess.run([sys.executable, "multi_device_cli.py", "--list-devices"])
+                run_module("multi_device_cli", "--list-devices", isolated=isolated)
             elif choice == "5":
                 print("Testing all devices...")
-                subprocess.run([sys.executable, "multi_device_cli.py", "--test-devices"])
+                run_module("multi_device_cli", "--test-devices", isolated=isolated)
             else:
                 print("Invalid choice. Please enter 0-5.")
                 
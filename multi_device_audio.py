@@ -10,8 +10,10 @@ import numpy as np
 import threading
 import time
 import os
+import mmap
 from typing import List, Dict, Optional, Callable
 from dataclasses import dataclass
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import queue
 
@@ -33,7 +35,7 @@ class AudioDevice:
 class AudioDeviceManager:
     """Manages multiple audio devices for simultaneous playback."""
     
-    def __init__(self):
+    def __init__(self, decode_cache_max_bytes: int = 0):
         self.devices: List[AudioDevice] = []
         self.active_streams: Dict[int, sd.OutputStream] = {}
         self.playback_threads: Dict[int, threading.Thread] = {}
@@ -41,6 +43,15 @@ class AudioDeviceManager:
         self.audio_queue = queue.Queue()
         self.is_playing = False
         self.max_simultaneous_streams = 4  # Limit to prevent ALSA overload
+        # Called (with no arguments) whenever get_device_status() may have changed
+        self.on_status_change: Optional[Callable[[], None]] = None
+        # Decoded files keyed by (path, mtime_ns, size), least recently used first.
+        # Off by default: only callers that replay the same file (the GUI) opt in;
+        # one-shot uploads would just fill it with decodes that are never reused.
+        self.decode_cache = OrderedDict()
+        self.decode_cache_max_bytes = decode_cache_max_bytes
+        self._decode_cache_bytes = 0
+        self._decode_cache_lock = threading.Lock()
         
     def discover_devices(self) -> List[AudioDevice]:
         """Discover all available audio output devices."""
@@ -108,12 +119,30 @@ class AudioDeviceManager:
         return results
     
     def load_audio_file(self, file_path: str) -> tuple:
-        """Load audio file and return data and sample rate."""
+        """Load audio file and return data and sample rate.
+
+        When the decode cache is enabled, decoded data is cached until the
+        file changes; the returned array is shared between callers and read-only.
+        """
         try:
-            if not os.path.exists(file_path):
+            try:
+                st = os.stat(file_path)
+            except FileNotFoundError:
                 raise FileNotFoundError(f"Audio file not found: {file_path}")
-                
-            data, sample_rate = sf.read(file_path, dtype='float32')
+            if st.st_size == 0:
+                raise ValueError("Empty audio file")
+            
+            cache_key = (file_path, st.st_mtime_ns, st.st_size)
+            if self.decode_cache_max_bytes:
+                with self._decode_cache_lock:
+                    cached = self.decode_cache.get(cache_key)
+                    if cached is not None:
+                        self.decode_cache.move_to_end(cache_key)
+                        return cached
+            
+            # Decode from a memory map so libsndfile reads straight from the page cache
+            with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                data, sample_rate = sf.read(mm, dtype='float32')
             
             if data.size == 0:
                 raise ValueError("Empty audio file")
@@ -123,12 +152,28 @@ class AudioDeviceManager:
                 data = data.reshape(-1, 1)  # Convert to 2D for consistency
                 
             print(f"Loaded audio: {file_path} ({sample_rate}Hz, {data.shape[1]} channels)")
+            data.setflags(write=False)
+            self._cache_decoded(cache_key, data, sample_rate)
             return data, sample_rate
             
         except Exception as e:
             print(f"Error loading audio file {file_path}: {e}")
             raise
     
+    def _cache_decoded(self, cache_key: tuple, data: np.ndarray, sample_rate: int):
+        """Remember a decoded file, evicting old entries past decode_cache_max_bytes."""
+        if data.nbytes > self.decode_cache_max_bytes:
+            return
+        with self._decode_cache_lock:
+            old = self.decode_cache.pop(cache_key, None)
+            if old is not None:
+                self._decode_cache_bytes -= old[0].nbytes
+            self.decode_cache[cache_key] = (data, sample_rate)
+            self._decode_cache_bytes += data.nbytes
+            while self._decode_cache_bytes > self.decode_cache_max_bytes:
+                _, (evicted, _) = self.decode_cache.popitem(last=False)
+                self._decode_cache_bytes -= evicted.nbytes
+    
     def play_on_device(self, device_index: int, audio_data: np.ndarray, 
                       sample_rate: int, callback: Optional[Callable] = None, 
                       status_callback: Optional[Callable] = None) -> bool:
@@ -177,6 +222,7 @@ class AudioDeviceManager:
                         status_callback(device_index, "Playing")
                     
                     stream.start()
+                    self._notify_status_change()
                     stream.write(audio_data)
                     
                     # Keep the stream running indefinitely until manually stopped
@@ -224,6 +270,7 @@ class AudioDeviceManager:
                             del self.stop_events[device_index]
                     except Exception as cleanup_error:
                         print(f"Error in cleanup: {cleanup_error}")
+                    self._notify_status_change()
             
             thread = threading.Thread(target=playback_thread, daemon=True)
             self.playback_threads[device_index] = thread
@@ -243,6 +290,16 @@ class AudioDeviceManager:
     def _on_device_finished(self, device_index: int):
         """Called when a device finishes playback."""
         print(f"Device {device_index} finished playback")
+        self._notify_status_change()
+    
+    def _notify_status_change(self):
+        """Tell the on_status_change listener, if any, that a status may have changed."""
+        listener = self.on_status_change
+        if listener is not None:
+            try:
+                listener()
+            except Exception as e:
+                print(f"Error in status listener: {e}")
     
     def play_on_all_devices(self, file_path: str, callback: Optional[Callable] = None) -> Dict[int, bool]:
         """Play audio file simultaneously on all available devices."""
@@ -253,8 +310,23 @@ class AudioDeviceManager:
         try:
             # Load audio file
             audio_data, sample_rate = self.load_audio_file(file_path)
-            
-            print(f"\nPlaying '{file_path}' on {len(self.devices)} devices simultaneously...")
+        except Exception as e:
+            print(f"Error in play_on_all_devices: {e}")
+            return {}
+        
+        print(f"\nPlaying '{file_path}' on {len(self.devices)} devices simultaneously...")
+        return self.play_array_on_all_devices(audio_data, sample_rate, callback)
+    
+    def play_array_on_all_devices(self, audio_data: np.ndarray, sample_rate: int,
+                                  callback: Optional[Callable] = None) -> Dict[int, bool]:
+        """Play already-decoded audio simultaneously on all available devices."""
+        if not self.devices:
+            print("No devices available. Run discover_devices() first.")
+            return {}
+        
+        try:
+            if audio_data.ndim == 1:
+                audio_data = audio_data.reshape(-1, 1)  # Same 2D layout as load_audio_file
             
             # Test devices first
             working_devices = []
@@ -294,10 +366,11 @@ class AudioDeviceManager:
                         results[device.index] = False
             
             self.is_playing = True
+            self._notify_status_change()
             return results
             
         except Exception as e:
-            print(f"Error in play_on_all_devices: {e}")
+            print(f"Error in play_array_on_all_devices: {e}")
             return {}
     
     def stop_all_playback(self):
@@ -369,6 +442,7 @@ class AudioDeviceManager:
         self.playback_threads.clear()
         self.stop_events.clear()
         self.is_playing = False  # Only set to False when manually stopped
+        self._notify_status_change()
 
         print("All playback stopped")
     
@@ -10,8 +10,8 @@ import os
 from multi_device_audio import AudioDeviceManager
 
 
-def main():
-    """Main function for command-line interface."""
+def main(argv=None):
+    """Main function for command-line interface; argv defaults to sys.argv[1:]."""
     parser = argparse.ArgumentParser(description="Play audio on all available devices simultaneously")
     parser.add_argument("file", nargs="?", help="Audio file to play")
     parser.add_argument("--list-devices", "-l", action="store_true", help="List all available audio devices")
@@ -20,7 +20,7 @@ def main():
     parser.add_argument("--duration", "-d", type=float, default=2.0, help="Duration for test tone (default: 2.0 seconds)")
     parser.add_argument("--frequency", "-f", type=float, default=440.0, help="Frequency for test tone (default: 440.0 Hz)")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Create manager
     manager = AudioDeviceManager()
@@ -59,14 +59,6 @@ def main():
             frequency=args.frequency
         )
         
-        # Save to temporary file
-        import tempfile
-        import soundfile as sf
-        
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-            sf.write(tmp_file.name, test_tone, sample_rate)
-            temp_file_path = tmp_file.name
-        
         try:
             success = manager.play_on_device(device_index, test_tone, sample_rate)
             if success:
@@ -75,12 +67,6 @@ def main():
                 print(f"✗ Device {device_index} test failed")
         except Exception as e:
             print(f"✗ Device {device_index} test error: {e}")
-        finally:
-            # Clean up
-            try:
-                os.unlink(temp_file_path)
-            except:
-                pass
         
         return 0
     
@@ -94,16 +80,8 @@ def main():
             frequency=args.frequency
         )
         
-        # Save to temporary file
-        import tempfile
-        import soundfile as sf
-        
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-            sf.write(tmp_file.name, test_tone, sample_rate)
-            temp_file_path = tmp_file.name
-        
         try:
-            results = manager.play_on_all_devices(temp_file_path)
+            results = manager.play_array_on_all_devices(test_tone, sample_rate)
             
             if results:
                 print(f"\nTest tone played on {len(results)} devices")
@@ -113,12 +91,6 @@ def main():
                 print("Failed to play test tone on any device")
         except Exception as e:
             print(f"Error playing test tone: {e}")
-        finally:
-            # Clean up
-            try:
-                os.unlink(temp_file_path)
-            except:
-                pass
         
         return 0
     
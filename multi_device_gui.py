@@ -6,7 +6,6 @@ PyQt5 interface for playing audio simultaneously across all available devices.
 
 import sys
 import os
-import tempfile
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                            QHBoxLayout, QGridLayout, QPushButton, QLabel, 
                            QTextEdit, QFrame, QScrollArea, QComboBox, 
@@ -14,7 +13,6 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                            QGroupBox, QListWidget, QListWidgetItem, QSplitter)
 from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QPropertyAnimation, QEasingCurve
 from PyQt5.QtGui import QFont, QPalette, QColor, QPainter, QPen, QBrush
-import soundfile as sf
 import numpy as np
 from multi_device_audio import AudioDeviceManager
 
@@ -166,7 +164,8 @@ class MultiDeviceAudioGUI(QMainWindow):
     
     def __init__(self):
         super().__init__()
-        self.manager = AudioDeviceManager()
+        # Replaying the same file is common here, so keep recent decodes around
+        self.manager = AudioDeviceManager(decode_cache_max_bytes=64 * 1024 * 1024)
         self.device_widgets = {}
         self.playback_worker = None
         self.current_file = None
@@ -546,14 +545,6 @@ class MultiDeviceAudioGUI(QMainWindow):
         if device_index in self.device_widgets:
             self.device_widgets[device_index].update_status("Testing...")
         
-        # Create test tone
-        test_tone, sample_rate = self.manager.create_test_tone(duration=1.0)
-        
-        # Save to temporary file
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-            sf.write(tmp_file.name, test_tone, sample_rate)
-            temp_file_path = tmp_file.name
-        
         try:
             # Test the device
             success = self.manager.test_device(device_index)
@@ -566,12 +557,6 @@ class MultiDeviceAudioGUI(QMainWindow):
         except Exception as e:
             self.update_device_status(device_index, f"Error: {e}")
             self.status_bar.showMessage(f"Device {device_index} test error: {e}")
-        finally:
-            # Clean up temp file
-            try:
-                os.unlink(temp_file_path)
-            except:
-                pass
     
     def test_all_devices(self):
         """Test all devices."""
@@ -605,14 +590,9 @@ class MultiDeviceAudioGUI(QMainWindow):
         # Create test tone
         test_tone, sample_rate = self.manager.create_test_tone(duration=2.0)
         
-        # Save to temporary file
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-            sf.write(tmp_file.name, test_tone, sample_rate)
-            temp_file_path = tmp_file.name
-        
         try:
-            # Play on all devices
-            results = self.manager.play_on_all_devices(temp_file_path)
+            # Play on all devices straight from memory
+            results = self.manager.play_array_on_all_devices(test_tone, sample_rate)
             
             if results:
                 self.status_bar.showMessage("Playing test tone on all devices...")
@@ -626,12 +606,6 @@ class MultiDeviceAudioGUI(QMainWindow):
                 
         except Exception as e:
             self.status_bar.showMessage(f"Error playing test tone: {e}")
-        finally:
-            # Clean up temp file
-            try:
-                os.unlink(temp_file_path)
-            except:
-                pass
     
     def on_test_tone_finished(self):
         """Handle test tone playback finished."""
@@ -646,7 +620,8 @@ class MultiDeviceAudioGUI(QMainWindow):
 
 def main():
     """Main function to run the GUI."""
-    app = QApplication(sys.argv)
+    # Reuse the application when started again from the launcher
+    app = QApplication.instance() or QApplication(sys.argv)
     
     # Set application style
     app.setStyle('Fusion')
@@ -9,7 +9,7 @@ import sys
 import webbrowser
 import time
 import threading
-from web_server import app, audio_manager
+from Latest import audio_manager, run_server
 
 
 def open_browser():
@@ -53,8 +53,8 @@ def main():
     browser_thread.start()
     
     try:
-        # Start Flask server
-        app.run(host='0.0.0.0', port=5000, debug=False, threaded=True)
+        # Start the server (waitress when installed, same settings as Latest.py)
+        run_server(host='0.0.0.0', port=5000)
     except KeyboardInterrupt:
         print("\n\nShutting down server...")
         print("Goodbye! 👋")
@@ -0,0 +1,260 @@
+# Shared window for the Korean -> multilang speech translator.
+# B&W_design.py runs it with a mock backend, Koran-selectedlan.py with the live one.
+from abc import ABC, abstractmethod
+
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout,
+    QLabel, QPushButton, QComboBox, QTextEdit, QSizePolicy
+)
+from PyQt5.QtCore import QObject, pyqtSignal, Qt, QSize, QRunnable, QThreadPool
+from PyQt5.QtGui import QFont, QIcon
+
+from languages import LANGS
+
+
+class Signals(QObject):
+    """Defines custom signals available from a worker thread."""
+    transcription_ready = pyqtSignal(str)
+    translation_ready = pyqtSignal(str, str)  # text, target language code
+    set_status = pyqtSignal(str)
+    playback_finished = pyqtSignal()
+
+signals = Signals()
+
+
+class Task(QRunnable):
+    """Runs a worker function on the shared thread pool."""
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+
+    def run(self):
+        self.fn(*self.args)
+
+
+class Backend(ABC):
+    """What MainWindow needs from a speech pipeline.
+
+    Every method runs on a pool thread and may block. Results are reported
+    through the module-level `signals`: record() emits transcription_ready,
+    translate() emits translation_ready. tts() returns when playback ends.
+    """
+    @abstractmethod
+    def record(self):
+        ...
+
+    @abstractmethod
+    def translate(self, text, target_code):
+        ...
+
+    @abstractmethod
+    def tts(self, text, target_code):
+        ...
+
+    def prefetch(self, text, target_code):
+        """Optionally prepare speech for a fresh translation before Play."""
+
+
+class MainWindow(QWidget):
+    # One stylesheet for the whole window so Qt parses it once
+    STYLE_SHEET = (
+        "QWidget { background-color: #f0f0f5; }"
+        "QLabel { color: #333; }"
+        "QPushButton { border-radius: 20px; padding: 10px; }"
+        "QTextEdit { background-color: white; border: 1px solid #ddd; border-radius: 15px; padding: 15px; }"
+        "QTextEdit#transText { color: #007aff; }"
+        "QPushButton#recordButton { background-color: white; border: 1px solid #333; border-radius: 50px; }"
+        "QPushButton#recordButton:pressed { background-color: #eee; }"
+        "QPushButton#playButton { background-color: #e0f7fa; border: none; border-radius: 15px; padding: 10px; color: #007aff; }"
+    )
+    TRANSLATION_PLACEHOLDER = "Translation will appear here..."
+    # Subclasses can let the user correct the recognized text before playing
+    SOURCE_EDITABLE = False
+    PLAY_LABEL = "▶️ Replay Audio"
+    # Shown on the record button when mic.png is missing, and as its tooltip
+    RECORD_LABEL = "🎤"
+    # Shared fonts, built on first use (QFont needs a QApplication)
+    _fonts = None
+
+    @classmethod
+    def fonts(cls):
+        if cls._fonts is None:
+            status = QFont('Arial', 12)
+            status.setItalic(True)
+            cls._fonts = {
+                "title": QFont('Arial', 12, QFont.Bold),
+                "body": QFont('Arial', 12),
+                "text": QFont('Arial', 16),
+                "button": QFont('Arial', 14),
+                "status": status,
+            }
+        return cls._fonts
+
+    def __init__(self, backend):
+        super().__init__()
+        self.backend = backend
+        self.setWindowTitle("Korean → Multilang Speech Translator (MCP)")
+      
+        self.setMinimumSize(400, 700)
+        self.setStyleSheet(self.STYLE_SHEET)
+        self.signals = signals
+        # reuse worker threads instead of spawning one per click
+        self.pool = QThreadPool.globalInstance()
+        self.pool.setMaxThreadCount(4)
+        self.target_lang_code = 'en' # Default language
+        self.init_ui()
+        self.connect_signals()
+
+    def init_ui(self):
+        fonts = self.fonts()
+        # Main Layout
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(30, 30, 30, 30)
+        main_layout.setSpacing(20)
+
+        # --- Top Bar (From/To) ---
+        top_bar_layout = QHBoxLayout()
+        # From Label
+        from_label = QLabel("From: Korean")
+        from_label.setFont(fonts["title"])
+
+        # Language Selection Dropdown
+        self.lang_box = QComboBox()
+        self.lang_box.setFont(fonts["body"])
+        for name in LANGS.keys():
+            if name != "Korean":  # source language is fixed
+                self.lang_box.addItem(name)
+        self.lang_box.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.lang_box.currentIndexChanged.connect(self.update_language)
+        self.target_lang_code = LANGS[self.lang_box.currentText()]
+        
+        top_bar_layout.addWidget(from_label)
+        top_bar_layout.addStretch(1)
+        top_bar_layout.addWidget(self.lang_box)
+
+        # --- Recognized Korean Text Area ---
+        self.orig_text = QTextEdit()
+        self.orig_text.setReadOnly(not self.SOURCE_EDITABLE)
+        self.orig_text.setFont(fonts["text"])
+        self.orig_text.setFixedHeight(100)
+
+        # --- Microphone/Record Button (Visual centerpiece) ---
+        self.record_button = QPushButton()
+        self.record_button.setObjectName("recordButton")
+        mic_icon = QIcon('mic.png') # Placeholder for a mic icon file
+        if mic_icon.isNull():
+            self.record_button.setText(self.RECORD_LABEL)
+        else:
+            self.record_button.setIcon(mic_icon)
+        self.record_button.setToolTip(self.RECORD_LABEL)
+        self.record_button.setIconSize(QSize(60, 60))
+        self.record_button.setFixedSize(100, 100)
+        self.record_button.clicked.connect(self.start_stt_thread)
+        
+        mic_layout = QHBoxLayout()
+        mic_layout.addStretch(1)
+        mic_layout.addWidget(self.record_button)
+        mic_layout.addStretch(1)
+
+        # --- Translated Text Area ---
+        self.trans_text = QTextEdit(self.TRANSLATION_PLACEHOLDER)
+        self.trans_text.setObjectName("transText")
+        self.trans_text.setReadOnly(True)
+        self.trans_text.setFont(fonts["text"])
+        self.trans_text.setFixedHeight(100)
+
+        # --- Play Audio Button ---
+        self.play_button = QPushButton(self.PLAY_LABEL)
+        self.play_button.setObjectName("playButton")
+        self.play_button.setFont(fonts["button"])
+        self.play_button.clicked.connect(self.start_tts_thread)
+        self.play_button.setEnabled(False) # Disabled until translation is ready
+
+        # --- Status Label ---
+        self.status_label = QLabel("Ready to record.")
+        self.status_label.setAlignment(Qt.AlignCenter)
+        self.status_label.setFont(fonts["status"])
+
+        # --- Add widgets to main layout ---
+        main_layout.addLayout(top_bar_layout)
+        main_layout.addWidget(QLabel("Korean Text:"))
+        main_layout.addWidget(self.orig_text)
+        main_layout.addLayout(mic_layout)
+        main_layout.addWidget(QLabel("Translation:"))
+        main_layout.addWidget(self.trans_text)
+        main_layout.addWidget(self.play_button)
+        main_layout.addWidget(self.status_label)
+        main_layout.addStretch(1) # Pushes everything up
+
+    def connect_signals(self):
+        """Connects custom signals to their respective slots (UI update methods)."""
+        self.signals.transcription_ready.connect(self.handle_transcription)
+        self.signals.translation_ready.connect(self.handle_translation)
+        self.signals.set_status.connect(self.status_label.setText)
+        self.signals.playback_finished.connect(self.handle_playback_finished)
+
+    def update_language(self):
+        """Updates the internal target language code based on the QComboBox selection."""
+        selected_lang = self.lang_box.currentText()
+        self.target_lang_code = LANGS[selected_lang]
+        self.status_label.setText(f"Target language set to: {selected_lang}")
+
+    # --- Threading Control Methods ---
+    def start_stt_thread(self):
+        """Starts the Speech-to-Text (Recording) process on the worker pool."""
+        self.record_button.setEnabled(False)
+        self.play_button.setEnabled(False)
+        self.orig_text.setPlainText("")
+        self.trans_text.setPlainText("...Listening and Transcribing...")
+        self.signals.set_status.emit("Recording...")
+
+        self.pool.start(Task(self.backend.record))
+
+    def start_translation_thread(self, text):
+        """Starts the Translation process on the worker pool."""
+        self.signals.set_status.emit("Translating...")
+        
+        self.pool.start(Task(self.backend.translate, text, self.target_lang_code))
+
+    def start_tts_thread(self):
+        """Starts the Text-to-Speech (Playback) process on the worker pool."""
+        translated_text = self.trans_text.toPlainText().strip()
+        if not translated_text or translated_text == self.TRANSLATION_PLACEHOLDER:
+            self.signals.set_status.emit("Nothing to play.")
+            return
+
+        self.play_button.setEnabled(False)
+        self.signals.set_status.emit("Playing audio...")
+
+        self.pool.start(Task(self.run_tts, translated_text, self.target_lang_code))
+
+    def run_tts(self, text, lang_code):
+        try:
+            self.backend.tts(text, lang_code)
+        finally:
+            self.signals.playback_finished.emit()
+
+    # --- Signal Slot Handlers (UI Update) ---
+    def handle_transcription(self, text):
+        """Updates the Korean text area and starts translation."""
+        self.orig_text.setPlainText(text)
+        self.record_button.setEnabled(True)
+        if not text:
+            self.trans_text.setPlainText("")
+            return
+        self.signals.set_status.emit("Transcription complete. Starting translation...")
+        self.start_translation_thread(text)
+
+    def handle_translation(self, translated_text, lang_code):
+        """Updates the translated text area and enables playback."""
+        self.trans_text.setPlainText(translated_text)
+        if not translated_text:
+            return
+        self.play_button.setEnabled(True)
+        self.signals.set_status.emit(f"Translation to {lang_code.upper()} complete. Ready to play.")
+        # let the backend synthesize speech early so Play starts sooner
+        self.pool.start(Task(self.backend.prefetch, translated_text.strip(), lang_code))
+
+    def handle_playback_finished(self):
+        self.play_button.setEnabled(True)